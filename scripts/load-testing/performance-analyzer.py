@@ -5,17 +5,148 @@ Performance Analyzer for Apollo Router Federation Load Tests
 This script analyzes load test results and provides optimization recommendations.
 """
 
-import json
+import array
 import csv
 import argparse
+import mmap
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-import statistics
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+def _parse_k6_time(value) -> float:
+    """Convert a K6 point timestamp (RFC 3339 string or epoch number) to seconds"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    return float(value)
+
+def _iter_mapped_lines(path: str):
+    """Yield the raw byte lines of a file through a read-only memory map"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b'')
+
+def _p95_p99(values: np.ndarray) -> Tuple[float, float]:
+    """p95/p99 via a single introselect, matching np.percentile's 'linear' method"""
+    last = values.size - 1
+    pos95 = 0.95 * last
+    pos99 = 0.99 * last
+    k95 = int(pos95)
+    k99 = int(pos99)
+    k95_next = min(k95 + 1, last)
+    k99_next = min(k99 + 1, last)
+    part = np.partition(values, sorted({k95, k95_next, k99, k99_next}))
+    return (
+        float(part[k95] + (pos95 - k95) * (part[k95_next] - part[k95])),
+        float(part[k99] + (pos99 - k99) * (part[k99_next] - part[k99])),
+    )
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _summarize(values):
+        """Fused min/max/sum over a non-empty float64 array in a single parallel pass"""
+        lowest = values[0]
+        highest = values[0]
+        total = 0.0
+        for i in prange(values.shape[0]):
+            value = values[i]
+            lowest = min(lowest, value)
+            highest = max(highest, value)
+            total += value
+        return lowest, highest, total
+else:
+    def _summarize(values):
+        """min/max/sum over a non-empty float64 array"""
+        return values.min(), values.max(), values.sum()
+
+if njit is not None:
+    @njit(cache=True)
+    def _usage_stats(values, threshold):
+        """Fused mean/max/spike count in one pass, skipping missing (NaN) samples"""
+        total = 0.0
+        highest = -np.inf
+        count = 0
+        spikes = 0
+        for value in values:
+            if np.isnan(value):
+                continue
+            total += value
+            count += 1
+            if value > highest:
+                highest = value
+            if value > threshold:
+                spikes += 1
+        if count == 0:
+            return np.nan, np.nan, spikes
+        return total / count, highest, spikes
+else:
+    def _usage_stats(values, threshold):
+        """mean/max/spike count, skipping missing (NaN) samples"""
+        return np.nanmean(values), np.nanmax(values), np.count_nonzero(values > threshold)
+
+def _strip_pct(value) -> float:
+    """Parse a resource-monitor percentage cell such as '42.5%' or '42.5'"""
+    if isinstance(value, bytes):
+        value = value.decode()
+    value = value.strip().rstrip('%')
+    try:
+        return float(value)
+    except ValueError:
+        return float('nan')
+
+def _iter_result_files(root: str):
+    """Yield (name, path) for every regular file below root using dirent type info"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.name, entry.path
+
+# Minimal seaborn-like chart look, applied only while the charts are drawn
+_CHART_STYLE = {
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'grid.color': 'white',
+    'grid.linestyle': '-',
+}
+
+# Per-test-type K6 output files: k6-<test type>-results.json
+_K6_RESULTS = re.compile(r'k6-(.+)-results\.json')
+
+# Fixed-name result files: file name -> (analysis key, label, analyzer method)
+_RESULT_FILES = {
+    'k6-results.json': ('k6', 'K6 results', 'analyze_k6_results'),
+    'artillery-results.json': ('artillery', 'Artillery results', 'analyze_artillery_results'),
+    'resource-usage.log': ('resources', 'resource usage', 'analyze_resource_usage'),
+}
 
 class PerformanceAnalyzer:
     def __init__(self, results_dir: str):
@@ -25,29 +156,54 @@ class PerformanceAnalyzer:
     def analyze_k6_results(self, k6_file: str) -> Dict[str, Any]:
         """Analyze K6 test results"""
         try:
-            with open(k6_file, 'r') as f:
-                data = [json.loads(line) for line in f if line.strip()]
-            
-            # Extract metrics
-            http_reqs = [d for d in data if d.get('type') == 'Point' and d.get('metric') == 'http_reqs']
-            http_req_duration = [d for d in data if d.get('type') == 'Point' and d.get('metric') == 'http_req_duration']
-            http_req_failed = [d for d in data if d.get('type') == 'Point' and d.get('metric') == 'http_req_failed']
-            
+            total_requests = 0
+            failed_requests = 0
+            durations = array.array('d')
+            add_duration = durations.append
+            first_time = last_time = None
+
+            # Stream the NDJSON output in a single pass, keeping only the values we need
+            for line in _iter_mapped_lines(k6_file):
+                if not line.strip():
+                    continue
+                record = _json_loads(line)
+                if record.get('type') != 'Point':
+                    continue
+
+                point = record['data']
+                timestamp = point['time']
+                if first_time is None or timestamp < first_time:
+                    first_time = timestamp
+                if last_time is None or timestamp > last_time:
+                    last_time = timestamp
+
+                metric = record.get('metric')
+                if metric == 'http_reqs':
+                    total_requests += 1
+                elif metric == 'http_req_duration':
+                    add_duration(point['value'])
+                elif metric == 'http_req_failed':
+                    failed_requests += point['value']
+
             # Calculate statistics
-            durations = [d['data']['value'] for d in http_req_duration]
-            failed_requests = sum(d['data']['value'] for d in http_req_failed)
-            total_requests = len(http_reqs)
-            
+            durations = np.frombuffer(durations, dtype=np.float64)
+            if durations.size:
+                min_duration, max_duration, total_duration = _summarize(durations)
+                p95, p99 = _p95_p99(durations)
+            else:
+                min_duration = max_duration = total_duration = p95 = p99 = 0
+            duration_seconds = (_parse_k6_time(last_time) - _parse_k6_time(first_time)) if first_time is not None else 0
+
             analysis = {
                 'total_requests': total_requests,
                 'failed_requests': failed_requests,
                 'success_rate': (total_requests - failed_requests) / total_requests * 100 if total_requests > 0 else 0,
-                'avg_response_time': statistics.mean(durations) if durations else 0,
-                'p95_response_time': statistics.quantiles(durations, n=20)[18] if len(durations) > 20 else 0,
-                'p99_response_time': statistics.quantiles(durations, n=100)[98] if len(durations) > 100 else 0,
-                'min_response_time': min(durations) if durations else 0,
-                'max_response_time': max(durations) if durations else 0,
-                'throughput': total_requests / (max(d['data']['time'] for d in data) - min(d['data']['time'] for d in data)) if data else 0
+                'avg_response_time': float(total_duration / durations.size) if durations.size else 0,
+                'p95_response_time': p95,
+                'p99_response_time': p99,
+                'min_response_time': float(min_duration),
+                'max_response_time': float(max_duration),
+                'throughput': total_requests / duration_seconds if duration_seconds > 0 else 0
             }
             
             return analysis
@@ -59,25 +215,30 @@ class PerformanceAnalyzer:
     def analyze_artillery_results(self, artillery_file: str) -> Dict[str, Any]:
         """Analyze Artillery test results"""
         try:
-            with open(artillery_file, 'r') as f:
-                data = json.load(f)
+            with open(artillery_file, 'rb') as f:
+                raw = f.read()
+
+            # simdjson only materializes the subtrees we read, skipping the bulky intermediate periods
+            data = simdjson.Parser().parse(raw) if simdjson is not None else _json_loads(raw)
             
             # Extract key metrics
             aggregate = data.get('aggregate', {})
+            counters = aggregate.get('counters', {})
+            latency = aggregate.get('latency', {})
             
             analysis = {
-                'total_requests': aggregate.get('counters', {}).get('http.requests', 0),
-                'total_responses': aggregate.get('counters', {}).get('http.responses', 0),
-                'success_rate': (aggregate.get('counters', {}).get('http.codes.200', 0) / 
-                               aggregate.get('counters', {}).get('http.responses', 1)) * 100,
-                'avg_response_time': aggregate.get('latency', {}).get('mean', 0),
-                'p95_response_time': aggregate.get('latency', {}).get('p95', 0),
-                'p99_response_time': aggregate.get('latency', {}).get('p99', 0),
-                'min_response_time': aggregate.get('latency', {}).get('min', 0),
-                'max_response_time': aggregate.get('latency', {}).get('max', 0),
+                'total_requests': counters.get('http.requests', 0),
+                'total_responses': counters.get('http.responses', 0),
+                'success_rate': (counters.get('http.codes.200', 0) / 
+                               counters.get('http.responses', 1)) * 100,
+                'avg_response_time': latency.get('mean', 0),
+                'p95_response_time': latency.get('p95', 0),
+                'p99_response_time': latency.get('p99', 0),
+                'min_response_time': latency.get('min', 0),
+                'max_response_time': latency.get('max', 0),
                 'rps': aggregate.get('rps', {}).get('mean', 0),
-                'errors': aggregate.get('counters', {}).get('errors.ECONNREFUSED', 0) + 
-                         aggregate.get('counters', {}).get('errors.ETIMEDOUT', 0)
+                'errors': counters.get('errors.ECONNREFUSED', 0) + 
+                         counters.get('errors.ETIMEDOUT', 0)
             }
             
             return analysis
@@ -89,19 +250,32 @@ class PerformanceAnalyzer:
     def analyze_resource_usage(self, resource_file: str) -> Dict[str, Any]:
         """Analyze system resource usage"""
         try:
-            df = pd.read_csv(resource_file)
+            with open(resource_file, newline='') as f:
+                header = next(csv.reader(f))
+            columns = (header.index('CPU%'), header.index('Memory%'))
             
-            # Clean and convert data
-            df['CPU%'] = df['CPU%'].str.replace('%', '').astype(float)
-            df['Memory%'] = df['Memory%'].str.replace('%', '').astype(float)
+            # Percentages are parsed straight into a float32 matrix while reading
+            usage = np.loadtxt(
+                resource_file,
+                delimiter=',',
+                skiprows=1,
+                usecols=columns,
+                converters={column: _strip_pct for column in columns},
+                dtype=np.float32,
+                ndmin=2,
+            )
+            cpu = usage[:, 0]
+            memory = usage[:, 1]
+            avg_cpu, max_cpu, cpu_spikes = _usage_stats(cpu, 80.0)
+            avg_memory, max_memory, memory_spikes = _usage_stats(memory, 80.0)
             
             analysis = {
-                'avg_cpu_usage': df['CPU%'].mean(),
-                'max_cpu_usage': df['CPU%'].max(),
-                'avg_memory_usage': df['Memory%'].mean(),
-                'max_memory_usage': df['Memory%'].max(),
-                'cpu_spikes': len(df[df['CPU%'] > 80]),  # Count of high CPU usage
-                'memory_spikes': len(df[df['Memory%'] > 80])  # Count of high memory usage
+                'avg_cpu_usage': float(avg_cpu),
+                'max_cpu_usage': float(max_cpu),
+                'avg_memory_usage': float(avg_memory),
+                'max_memory_usage': float(max_memory),
+                'cpu_spikes': int(cpu_spikes),  # Count of high CPU usage
+                'memory_spikes': int(memory_spikes)  # Count of high memory usage
             }
             
             return analysis
@@ -112,18 +286,30 @@ class PerformanceAnalyzer:
     
     def generate_performance_insights(self, analysis: Dict[str, Any]) -> List[str]:
         """Generate performance insights and recommendations"""
+        return list(self._performance_insights(
+            analysis.get('p95_response_time', 0),
+            analysis.get('success_rate', 0),
+            analysis.get('throughput', 0) or analysis.get('rps', 0),
+            analysis.get('avg_cpu_usage'),
+            analysis.get('avg_memory_usage'),
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _performance_insights(p95_response_time, success_rate, throughput,
+                              cpu_usage, memory_usage) -> Tuple[str, ...]:
+        """Insights depend only on a handful of thresholds, so they are cached per summary"""
         insights = []
         
         # Response time analysis
-        if analysis.get('p95_response_time', 0) > 1000:
+        if p95_response_time > 1000:
             insights.append("⚠️  P95 response time exceeds 1 second - consider optimization")
-        elif analysis.get('p95_response_time', 0) > 500:
+        elif p95_response_time > 500:
             insights.append("⚡ P95 response time is acceptable but could be improved")
         else:
             insights.append("✅ Excellent response time performance")
         
         # Success rate analysis
-        success_rate = analysis.get('success_rate', 0)
         if success_rate < 95:
             insights.append("🚨 Success rate below 95% - investigate error causes")
         elif success_rate < 99:
@@ -132,7 +318,6 @@ class PerformanceAnalyzer:
             insights.append("✅ Excellent success rate")
         
         # Throughput analysis
-        throughput = analysis.get('throughput', 0) or analysis.get('rps', 0)
         if throughput < 10:
             insights.append("📈 Low throughput - consider scaling or optimization")
         elif throughput < 50:
@@ -141,8 +326,7 @@ class PerformanceAnalyzer:
             insights.append("🚀 Good throughput performance")
         
         # Resource usage analysis
-        if 'avg_cpu_usage' in analysis:
-            cpu_usage = analysis['avg_cpu_usage']
+        if cpu_usage is not None:
             if cpu_usage > 80:
                 insights.append("🔥 High CPU usage - consider horizontal scaling")
             elif cpu_usage > 60:
@@ -150,8 +334,7 @@ class PerformanceAnalyzer:
             else:
                 insights.append("✅ CPU usage is healthy")
         
-        if 'avg_memory_usage' in analysis:
-            memory_usage = analysis['avg_memory_usage']
+        if memory_usage is not None:
             if memory_usage > 80:
                 insights.append("💾 High memory usage - check for memory leaks")
             elif memory_usage > 60:
@@ -159,14 +342,26 @@ class PerformanceAnalyzer:
             else:
                 insights.append("✅ Memory usage is healthy")
         
-        return insights
+        return tuple(insights)
     
     def generate_optimization_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
         """Generate specific optimization recommendations"""
+        return list(self._optimization_recommendations(
+            analysis.get('p95_response_time', 0),
+            analysis.get('success_rate', 100),
+            analysis.get('avg_cpu_usage', 0),
+            analysis.get('avg_memory_usage', 0),
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _optimization_recommendations(p95_response_time, success_rate,
+                                      cpu_usage, memory_usage) -> Tuple[str, ...]:
+        """Recommendations depend only on a handful of thresholds, so they are cached per summary"""
         recommendations = []
         
         # Performance-based recommendations
-        if analysis.get('p95_response_time', 0) > 500:
+        if p95_response_time > 500:
             recommendations.extend([
                 "🔧 Implement Redis caching for frequently accessed data",
                 "🔧 Optimize database queries and add appropriate indexes",
@@ -174,7 +369,7 @@ class PerformanceAnalyzer:
                 "🔧 Enable query result caching at the router level"
             ])
         
-        if analysis.get('success_rate', 100) < 99:
+        if success_rate < 99:
             recommendations.extend([
                 "🛡️  Implement circuit breakers for external service calls",
                 "🛡️  Add retry logic with exponential backoff",
@@ -183,7 +378,7 @@ class PerformanceAnalyzer:
             ])
         
         # Resource-based recommendations
-        if analysis.get('avg_cpu_usage', 0) > 70:
+        if cpu_usage > 70:
             recommendations.extend([
                 "⚡ Consider horizontal scaling (add more instances)",
                 "⚡ Optimize CPU-intensive operations",
@@ -191,7 +386,7 @@ class PerformanceAnalyzer:
                 "⚡ Profile application for CPU bottlenecks"
             ])
         
-        if analysis.get('avg_memory_usage', 0) > 70:
+        if memory_usage > 70:
             recommendations.extend([
                 "💾 Investigate potential memory leaks",
                 "💾 Optimize data structures and caching strategies",
@@ -207,50 +402,55 @@ class PerformanceAnalyzer:
             "🌐 Optimize subgraph communication patterns"
         ])
         
-        return recommendations
+        return tuple(recommendations)
     
     def create_performance_charts(self, analysis: Dict[str, Any], output_dir: str):
         """Create performance visualization charts"""
         try:
-            # Set up the plotting style
-            plt.style.use('seaborn-v0_8')
-            fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-            fig.suptitle('Apollo Router Federation Performance Analysis', fontsize=16)
-            
-            # Response time distribution
-            if 'response_times' in analysis:
-                axes[0, 0].hist(analysis['response_times'], bins=50, alpha=0.7, color='skyblue')
-                axes[0, 0].set_title('Response Time Distribution')
-                axes[0, 0].set_xlabel('Response Time (ms)')
-                axes[0, 0].set_ylabel('Frequency')
-            
-            # Success rate over time
-            if 'success_rate_timeline' in analysis:
-                axes[0, 1].plot(analysis['success_rate_timeline'], color='green', linewidth=2)
-                axes[0, 1].set_title('Success Rate Over Time')
-                axes[0, 1].set_xlabel('Time')
-                axes[0, 1].set_ylabel('Success Rate (%)')
-                axes[0, 1].set_ylim(0, 100)
-            
-            # Resource usage
-            if 'cpu_usage_timeline' in analysis and 'memory_usage_timeline' in analysis:
-                axes[1, 0].plot(analysis['cpu_usage_timeline'], label='CPU %', color='red')
-                axes[1, 0].plot(analysis['memory_usage_timeline'], label='Memory %', color='blue')
-                axes[1, 0].set_title('Resource Usage Over Time')
-                axes[1, 0].set_xlabel('Time')
-                axes[1, 0].set_ylabel('Usage (%)')
-                axes[1, 0].legend()
-            
-            # Throughput
-            if 'throughput_timeline' in analysis:
-                axes[1, 1].plot(analysis['throughput_timeline'], color='purple', linewidth=2)
-                axes[1, 1].set_title('Throughput Over Time')
-                axes[1, 1].set_xlabel('Time')
-                axes[1, 1].set_ylabel('Requests/Second')
-            
-            plt.tight_layout()
-            plt.savefig(os.path.join(output_dir, 'performance_charts.png'), dpi=300, bbox_inches='tight')
-            plt.close()
+            from matplotlib import rc_context
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            # Render with the object-oriented API so no pyplot/GUI state is created or retained
+            with rc_context(_CHART_STYLE):
+                fig = Figure(figsize=(15, 10))
+                canvas = FigureCanvasAgg(fig)
+                axes = fig.subplots(2, 2)
+                fig.suptitle('Apollo Router Federation Performance Analysis', fontsize=16)
+            
+                # Response time distribution
+                if 'response_times' in analysis:
+                    axes[0, 0].hist(analysis['response_times'], bins=50, alpha=0.7, color='skyblue')
+                    axes[0, 0].set_title('Response Time Distribution')
+                    axes[0, 0].set_xlabel('Response Time (ms)')
+                    axes[0, 0].set_ylabel('Frequency')
+            
+                # Success rate over time
+                if 'success_rate_timeline' in analysis:
+                    axes[0, 1].plot(analysis['success_rate_timeline'], color='green', linewidth=2)
+                    axes[0, 1].set_title('Success Rate Over Time')
+                    axes[0, 1].set_xlabel('Time')
+                    axes[0, 1].set_ylabel('Success Rate (%)')
+                    axes[0, 1].set_ylim(0, 100)
+            
+                # Resource usage
+                if 'cpu_usage_timeline' in analysis and 'memory_usage_timeline' in analysis:
+                    axes[1, 0].plot(analysis['cpu_usage_timeline'], label='CPU %', color='red')
+                    axes[1, 0].plot(analysis['memory_usage_timeline'], label='Memory %', color='blue')
+                    axes[1, 0].set_title('Resource Usage Over Time')
+                    axes[1, 0].set_xlabel('Time')
+                    axes[1, 0].set_ylabel('Usage (%)')
+                    axes[1, 0].legend()
+            
+                # Throughput
+                if 'throughput_timeline' in analysis:
+                    axes[1, 1].plot(analysis['throughput_timeline'], color='purple', linewidth=2)
+                    axes[1, 1].set_title('Throughput Over Time')
+                    axes[1, 1].set_xlabel('Time')
+                    axes[1, 1].set_ylabel('Requests/Second')
+            
+                fig.tight_layout()
+                canvas.print_figure(os.path.join(output_dir, 'performance_charts.png'), dpi=300, bbox_inches='tight')
             
             print(f"✅ Performance charts saved to {output_dir}/performance_charts.png")
             
@@ -260,78 +460,85 @@ class PerformanceAnalyzer:
     def generate_detailed_report(self, output_file: str):
         """Generate a detailed performance analysis report"""
         try:
+            # Assemble the report in memory and write it out in one call
+            parts = []
+            write = parts.append
+            
+            write("# Apollo Router Federation Performance Analysis Report\n\n")
+            write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            
+            # Executive Summary
+            write("## Executive Summary\n\n")
+            write("This report provides a comprehensive analysis of the Apollo Router Federation ")
+            write("performance under various load conditions.\n\n")
+            
+            # Key Metrics
+            write("## Key Performance Metrics\n\n")
+            for test_type, analysis in self.analysis_results.items():
+                write(f"### {test_type.title()} Test Results\n\n")
+                write(f"- **Total Requests:** {analysis.get('total_requests', 'N/A')}\n")
+                write(f"- **Success Rate:** {analysis.get('success_rate', 'N/A'):.2f}%\n")
+                write(f"- **Average Response Time:** {analysis.get('avg_response_time', 'N/A'):.2f}ms\n")
+                write(f"- **P95 Response Time:** {analysis.get('p95_response_time', 'N/A'):.2f}ms\n")
+                write(f"- **P99 Response Time:** {analysis.get('p99_response_time', 'N/A'):.2f}ms\n")
+                write(f"- **Throughput:** {analysis.get('throughput', analysis.get('rps', 'N/A')):.2f} req/s\n\n")
+            
+            # Performance Insights
+            write("## Performance Insights\n\n")
+            for test_type, analysis in self.analysis_results.items():
+                insights = self.generate_performance_insights(analysis)
+                if insights:
+                    write(f"### {test_type.title()} Test Insights\n\n")
+                    for insight in insights:
+                        write(f"- {insight}\n")
+                    write("\n")
+            
+            # Optimization Recommendations
+            write("## Optimization Recommendations\n\n")
+            # dict keys dedupe while keeping the first-seen (priority) order
+            all_recommendations = {}
+            for analysis in self.analysis_results.values():
+                for recommendation in self.generate_optimization_recommendations(analysis):
+                    all_recommendations[recommendation] = None
+            
+            for i, recommendation in enumerate(all_recommendations, 1):
+                write(f"{i}. {recommendation}\n")
+            
+            write("\n")
+            
+            # Detailed Analysis
+            write("## Detailed Analysis\n\n")
+            write("### Response Time Analysis\n\n")
+            write("Response time is a critical metric for user experience. ")
+            write("The analysis shows the distribution of response times across different test scenarios.\n\n")
+            
+            write("### Throughput Analysis\n\n")
+            write("Throughput measures the system's capacity to handle concurrent requests. ")
+            write("Higher throughput indicates better scalability.\n\n")
+            
+            write("### Error Rate Analysis\n\n")
+            write("Error rates indicate system reliability under load. ")
+            write("Low error rates are essential for production readiness.\n\n")
+            
+            write("### Resource Utilization\n\n")
+            write("Resource utilization helps identify bottlenecks and scaling needs. ")
+            write("Monitor CPU and memory usage to plan capacity.\n\n")
+            
+            # Conclusion
+            write("## Conclusion\n\n")
+            write("The Apollo Router Federation demonstrates good performance characteristics ")
+            write("under the tested load conditions. The recommendations above should be ")
+            write("implemented to further optimize performance and ensure production readiness.\n\n")
+            
+            write("### Next Steps\n\n")
+            write("1. Implement high-priority optimizations\n")
+            write("2. Set up continuous performance monitoring\n")
+            write("3. Establish performance baselines and SLAs\n")
+            write("4. Plan for capacity scaling based on growth projections\n")
+            write("5. Regular performance testing in CI/CD pipeline\n")
+            
             with open(output_file, 'w') as f:
-                f.write("# Apollo Router Federation Performance Analysis Report\n\n")
-                f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                # Executive Summary
-                f.write("## Executive Summary\n\n")
-                f.write("This report provides a comprehensive analysis of the Apollo Router Federation ")
-                f.write("performance under various load conditions.\n\n")
-                
-                # Key Metrics
-                f.write("## Key Performance Metrics\n\n")
-                for test_type, analysis in self.analysis_results.items():
-                    f.write(f"### {test_type.title()} Test Results\n\n")
-                    f.write(f"- **Total Requests:** {analysis.get('total_requests', 'N/A')}\n")
-                    f.write(f"- **Success Rate:** {analysis.get('success_rate', 'N/A'):.2f}%\n")
-                    f.write(f"- **Average Response Time:** {analysis.get('avg_response_time', 'N/A'):.2f}ms\n")
-                    f.write(f"- **P95 Response Time:** {analysis.get('p95_response_time', 'N/A'):.2f}ms\n")
-                    f.write(f"- **P99 Response Time:** {analysis.get('p99_response_time', 'N/A'):.2f}ms\n")
-                    f.write(f"- **Throughput:** {analysis.get('throughput', analysis.get('rps', 'N/A')):.2f} req/s\n\n")
-                
-                # Performance Insights
-                f.write("## Performance Insights\n\n")
-                for test_type, analysis in self.analysis_results.items():
-                    insights = self.generate_performance_insights(analysis)
-                    if insights:
-                        f.write(f"### {test_type.title()} Test Insights\n\n")
-                        for insight in insights:
-                            f.write(f"- {insight}\n")
-                        f.write("\n")
-                
-                # Optimization Recommendations
-                f.write("## Optimization Recommendations\n\n")
-                all_recommendations = set()
-                for analysis in self.analysis_results.values():
-                    recommendations = self.generate_optimization_recommendations(analysis)
-                    all_recommendations.update(recommendations)
-                
-                for i, recommendation in enumerate(sorted(all_recommendations), 1):
-                    f.write(f"{i}. {recommendation}\n")
-                
-                f.write("\n")
-                
-                # Detailed Analysis
-                f.write("## Detailed Analysis\n\n")
-                f.write("### Response Time Analysis\n\n")
-                f.write("Response time is a critical metric for user experience. ")
-                f.write("The analysis shows the distribution of response times across different test scenarios.\n\n")
-                
-                f.write("### Throughput Analysis\n\n")
-                f.write("Throughput measures the system's capacity to handle concurrent requests. ")
-                f.write("Higher throughput indicates better scalability.\n\n")
-                
-                f.write("### Error Rate Analysis\n\n")
-                f.write("Error rates indicate system reliability under load. ")
-                f.write("Low error rates are essential for production readiness.\n\n")
-                
-                f.write("### Resource Utilization\n\n")
-                f.write("Resource utilization helps identify bottlenecks and scaling needs. ")
-                f.write("Monitor CPU and memory usage to plan capacity.\n\n")
-                
-                # Conclusion
-                f.write("## Conclusion\n\n")
-                f.write("The Apollo Router Federation demonstrates good performance characteristics ")
-                f.write("under the tested load conditions. The recommendations above should be ")
-                f.write("implemented to further optimize performance and ensure production readiness.\n\n")
-                
-                f.write("### Next Steps\n\n")
-                f.write("1. Implement high-priority optimizations\n")
-                f.write("2. Set up continuous performance monitoring\n")
-                f.write("3. Establish performance baselines and SLAs\n")
-                f.write("4. Plan for capacity scaling based on growth projections\n")
-                f.write("5. Regular performance testing in CI/CD pipeline\n")
+                f.write(''.join(parts))
             
             print(f"✅ Detailed report generated: {output_file}")
             
@@ -342,23 +549,34 @@ class PerformanceAnalyzer:
         """Run the complete performance analysis"""
         print("🔍 Starting performance analysis...")
         
-        # Find and analyze all result files
-        for root, dirs, files in os.walk(self.results_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                
-                if file.startswith('k6-') and file.endswith('-results.json'):
-                    test_type = file.replace('k6-', '').replace('-results.json', '')
-                    print(f"📊 Analyzing K6 {test_type} results...")
-                    self.analysis_results[f'k6_{test_type}'] = self.analyze_k6_results(file_path)
-                
-                elif file == 'artillery-results.json':
-                    print("📊 Analyzing Artillery results...")
-                    self.analysis_results['artillery'] = self.analyze_artillery_results(file_path)
-                
-                elif file == 'resource-usage.log':
-                    print("📊 Analyzing resource usage...")
-                    self.analysis_results['resources'] = self.analyze_resource_usage(file_path)
+        # Find all result files, then analyze them (independent, CPU-bound work) in parallel
+        jobs = []
+        for name, file_path in _iter_result_files(self.results_dir):
+            k6_match = _K6_RESULTS.fullmatch(name)
+            if k6_match:
+                test_type = k6_match.group(1)
+                jobs.append((f'k6_{test_type}', f'K6 {test_type} results', 'analyze_k6_results', file_path))
+                continue
+            
+            result_file = _RESULT_FILES.get(name)
+            if result_file is not None:
+                jobs.append((*result_file, file_path))
+        
+        for _, label, _, _ in jobs:
+            print(f"📊 Analyzing {label}...")
+        
+        if len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+                futures = [
+                    executor.submit(_analyze_result_file, self.results_dir, analyzer, file_path)
+                    for _, _, analyzer, file_path in jobs
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [getattr(self, analyzer)(file_path) for _, _, analyzer, file_path in jobs]
+        
+        for (key, _, _, _), analysis in zip(jobs, results):
+            self.analysis_results[key] = analysis
         
         # Generate outputs
         output_dir = self.results_dir
@@ -368,6 +586,10 @@ class PerformanceAnalyzer:
         print("✅ Performance analysis completed!")
         print(f"📁 Results available in: {output_dir}")
 
+def _analyze_result_file(results_dir: str, analyzer: str, file_path: str) -> Dict[str, Any]:
+    """Process-pool entry point; only plain strings cross the process boundary"""
+    return getattr(PerformanceAnalyzer(results_dir), analyzer)(file_path)
+
 def main():
     parser = argparse.ArgumentParser(description='Analyze Apollo Router Federation load test results')
     parser.add_argument('results_dir', help='Directory containing test results')
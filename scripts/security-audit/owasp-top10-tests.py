@@ -16,67 +16,440 @@ This script specifically tests for OWASP Top 10 vulnerabilities:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import re
+import sys
 import time
 import base64
+from functools import lru_cache
+from itertools import islice
+from collections import defaultdict, deque, namedtuple
 import hashlib
-import random
-import string
-from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin, urlparse
-import subprocess
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
+
+try:
+    # orjson encodes straight to bytes and decodes several times faster; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same
+    from orjson import dumps as _json_dumps, loads as _json_loads, OPT_INDENT_2
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return _json_dumps(obj, option=OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Severities that make an OWASP category non-compliant
+HIGH_SEVERITIES = frozenset(('CRITICAL', 'HIGH'))
+
+OWASP_CATEGORY_NAMES = {
+    'A01:2021': 'Broken Access Control',
+    'A02:2021': 'Cryptographic Failures',
+    'A03:2021': 'Injection',
+    'A04:2021': 'Insecure Design',
+    'A05:2021': 'Security Misconfiguration',
+    'A06:2021': 'Vulnerable and Outdated Components',
+    'A07:2021': 'Identification and Authentication Failures',
+    'A08:2021': 'Software and Data Integrity Failures',
+    'A09:2021': 'Security Logging and Monitoring Failures',
+    'A10:2021': 'Server-Side Request Forgery (SSRF)'
+}
+
+# Remediation advice per OWASP category, in report order
+OWASP_RECOMMENDATIONS = {
+    'A01:2021': (
+        "🔒 Implement proper access control checks for all operations",
+        "🔐 Use role-based access control (RBAC) consistently",
+        "🛡️ Validate user permissions at the API level"
+    ),
+    'A02:2021': (
+        "🔐 Enforce HTTPS for all communications",
+        "🔑 Use strong cryptographic algorithms (AES-256, RSA-2048+)",
+        "🛡️ Implement proper key management"
+    ),
+    'A03:2021': (
+        "💉 Use parameterized queries to prevent SQL injection",
+        "🛡️ Implement input validation and sanitization",
+        "🔍 Use GraphQL query complexity analysis"
+    ),
+    'A04:2021': (
+        "🏗️ Implement proper business logic validation",
+        "🔄 Add concurrency controls for critical operations",
+        "📋 Conduct threat modeling for business processes"
+    ),
+    'A05:2021': (
+        "⚙️ Disable GraphQL introspection in production",
+        "🔧 Remove verbose error messages",
+        "🛡️ Implement security headers and configurations"
+    ),
+    'A06:2021': (
+        "📦 Keep all dependencies up to date",
+        "🔍 Regular vulnerability scanning of components",
+        "🚫 Remove unused dependencies and features"
+    ),
+    'A07:2021': (
+        "🔐 Implement strong authentication mechanisms",
+        "🛡️ Add brute force protection",
+        "⏰ Use appropriate session timeouts"
+    ),
+    'A08:2021': (
+        "✅ Implement JWT signature verification",
+        "🔍 Add data integrity checks",
+        "🛡️ Use secure software update mechanisms"
+    ),
+    'A09:2021': (
+        "📊 Implement comprehensive security logging",
+        "🚨 Set up security monitoring and alerting",
+        "📈 Monitor for suspicious activities"
+    ),
+    'A10:2021': (
+        "🌐 Validate and sanitize all URLs",
+        "🚫 Implement URL whitelist for external requests",
+        "🔒 Use network segmentation to limit SSRF impact"
+    )
+}
+
+# Response scanners: one compiled alternation instead of a substring test per needle
+SQL_ERROR_RE = re.compile(r'syntax error|mysql|postgresql|sql server|ora-', re.IGNORECASE)
+VERBOSE_ERROR_RE = re.compile(r'database|internal|server|path|file', re.IGNORECASE)
+SSRF_ERROR_RE = re.compile(r'connection refused|timeout|unreachable|internal server|network error', re.IGNORECASE)
+# Locates the schema object in a raw introspection body without materializing it
+SCHEMA_OBJECT_RE = re.compile(rb'"__schema"\s*:\s*\{')
+
+# Injection probe documents: payloads travel as variables so the router parses and plans each document once
+SQL_TEST_QUERY = """
+query SQLInjectionTest($id: ID!) {
+  review(id: $id) {
+    id
+    text
+  }
+}
+"""
+
+NOSQL_TEST_QUERY = """
+query NoSQLInjectionTest($filter: ReviewsFilter) {
+  reviews(filter: $filter, first: 10) {
+    edges {
+      node {
+        id
+      }
+    }
+  }
+}
+"""
+
+# Payloads are spliced into the document text itself - that is what this probe tests
+GRAPHQL_INJECTION_TEST_QUERY = """
+query GraphQLInjectionTest {{
+  user(id: "{payload}") {{
+    id
+    name
+  }}
+}}
+"""
+
+# Probe inputs, built once at import
+SQL_PAYLOADS = (
+    "' OR '1'='1' --",
+    "'; DROP TABLE reviews; --",
+    "' UNION SELECT password FROM users --",
+    "1' OR 1=1 --"
+)
+
+NOSQL_PAYLOADS = (
+    {"$ne": None},
+    {"$regex": ".*"},
+    {"$where": "1==1"},
+    {"$gt": ""}
+)
+
+GRAPHQL_INJECTION_PAYLOADS = (
+    '") { id } user(id: "1',
+    '") { password } user(id: "1',
+    '") { __schema { types { name } } } user(id: "1'
+)
+GRAPHQL_INJECTION_QUERIES = tuple(
+    GRAPHQL_INJECTION_TEST_QUERY.format(payload=payload) for payload in GRAPHQL_INJECTION_PAYLOADS
+)
+
+DEFAULT_CREDS = (
+    ("admin", "admin"),
+    ("admin", "password"),
+    ("root", "root"),
+    ("test", "test")
+)
+
+VULN_SERVER_PATTERNS = (
+    'nginx/1.14',  # Example of potentially outdated version
+    'Apache/2.2',  # Very old Apache version
+    'Express',     # Exposing framework information
+)
+
+VULN_ENDPOINTS = (
+    '/admin',
+    '/debug',
+    '/test',
+    '/api/v1',
+    '/graphiql',
+    '/playground'
+)
+
+BRUTE_FORCE_PASSWORDS = tuple(f"wrongpassword{i}" for i in range(10))
+
+SSRF_PAYLOADS = (
+    "http://localhost:22",  # SSH port
+    "http://127.0.0.1:3306",  # MySQL port
+    "http://169.254.169.254/latest/meta-data/",  # AWS metadata
+    "file:///etc/passwd",  # Local file access
+    "http://internal-service:8080",  # Internal service
+)
+
+UPDATE_PROFILE_MUTATION = """
+mutation UpdateProfile($input: UpdateProfileInput!) {
+  updateProfile(input: $input) {
+    id
+    avatarUrl
+  }
+}
+"""
+
+TYPENAME_QUERY = 'query { __typename }'
+
+INTROSPECTION_QUERY = """
+query IntrospectionQuery {
+  __schema {
+    queryType { name }
+    mutationType { name }
+    types { name }
+  }
+}
+"""
+
+# APQ hash for the document sent through make_persisted_request
+TYPENAME_QUERY_HASH = hashlib.sha256(TYPENAME_QUERY.encode()).hexdigest()
+
+# Per-request timeout (seconds) and body cap for potentially huge responses such as introspection
+REQUEST_TIMEOUT = 5
+# SSRF probes may legitimately stall on the target URL; allow long enough to observe a time-based hit
+SSRF_TIMEOUT = 10
+# Wall-time budget for the whole rate-limit burst
+RATE_LIMIT_DEADLINE = 2.0
+MAX_RESPONSE_BYTES = 1 << 20
+_READ_CHUNK = 8192
+
+# Pre-encoded body for one-off probes that only need a trivial operation
+_TYPENAME_BODY = _json_dumps({'query': TYPENAME_QUERY, 'variables': {}})
+
+# Signature swapped into the auth token to check that tampered JWTs are rejected
+_TAMPERED_SIGNATURE = base64.urlsafe_b64encode(b'modified_signature').decode().rstrip('=')
+
+@lru_cache(maxsize=8)
+def _decode_jwt(token: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """Decode a JWT's header and claims without verifying it; (None, None) if malformed"""
+    parts = token.split('.')
+    if len(parts) != 3:
+        return None, None
+    try:
+        header = _json_loads(base64.urlsafe_b64decode(parts[0] + '=='))
+        payload = _json_loads(base64.urlsafe_b64decode(parts[1] + '=='))
+    except ValueError:
+        return None, None
+    if not (isinstance(header, dict) and isinstance(payload, dict)):
+        return None, None
+    return header, payload
+
+# Compact record per finding; converted to dicts only when the report is built
+Finding = namedtuple('Finding', 'owasp_category severity title description evidence timestamp')
 
 class OWASPTop10Tester:
-    def __init__(self, base_url: str, auth_token: Optional[str] = None):
+    def __init__(self, base_url: str, auth_token: Optional[str] = None, findings_log: Optional[str] = None):
         self.base_url = base_url.rstrip('/')
-        self.graphql_url = urljoin(self.base_url, '/graphql')
+        self.graphql_url = f'{self.base_url}/graphql'
         self.auth_token = auth_token
-        self.session = requests.Session()
-        self.findings = []
-        
-        self.session.headers.update({
+        self.timeout = REQUEST_TIMEOUT
+        self._local = threading.local()
+        self.findings = deque()
+        self._persisted_hashes = set()
+        self._findings_lock = threading.Lock()
+        
+        # Optional NDJSON journal: each finding is written as it is found, so a crashed scan
+        # still leaves its results on disk
+        self.findings_log = findings_log
+        self._findings_fp = None
+        
+        # One warm keep-alive pool large enough for the concurrent probes and the race-condition test.
+        # Targets are usually plain http://, where HTTP/2 would need prior knowledge, so reuse comes
+        # from keep-alive connections rather than multiplexing. Every probe targets the same origin,
+        # so a single host pool, shared by every thread's session, is enough.
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=64, max_retries=0)
+        
+        self.default_headers = {
             'Content-Type': 'application/json',
-            'User-Agent': 'OWASP-Top10-Tester/1.0'
-        })
+            'User-Agent': 'OWASP-Top10-Tester/1.0',
+            'Connection': 'keep-alive'
+        }
+        
+        if auth_token:
+            self.default_headers['Authorization'] = f'Bearer {auth_token}'
         
+        # Split and decode the token header/claims once; several tests inspect them
+        self._jwt_parts = self._jwt_header = self._jwt_payload = None
         if auth_token:
-            self.session.headers['Authorization'] = f'Bearer {auth_token}'
+            parts = auth_token.split('.')
+            if len(parts) == 3:
+                self._jwt_parts = parts
+            self._jwt_header, self._jwt_payload = _decode_jwt(auth_token)
     
-    def log_finding(self, owasp_category: str, severity: str, title: str, description: str, evidence: str = ""):
-        """Log an OWASP Top 10 finding"""
-        finding = {
-            'owasp_category': owasp_category,
-            'severity': severity,
-            'title': title,
-            'description': description,
-            'evidence': evidence,
-            'timestamp': time.time()
-        }
-        self.findings.append(finding)
+    @property
+    def session(self) -> requests.Session:
+        """Per-thread session (Session is not thread-safe) sharing the tester's connection pool"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            session.headers.update(self.default_headers)
+        return session
+    
+    def log_finding(self, owasp_category: str, severity: str, title: str, description: str,
+                    evidence: Union[str, Dict[str, Any]] = ""):
+        """Log an OWASP Top 10 finding
+        
+        Structured evidence is kept as-is and serialized with the rest of the report.
+        """
+        # Interned so report aggregation compares category/severity keys by identity
+        finding = Finding(sys.intern(owasp_category), sys.intern(severity), title, description, evidence, time.time())
         
-        print(f"[{owasp_category}] [{severity}] {title}")
-        print(f"  {description}")
+        lines = [f"[{owasp_category}] [{severity}] {title}", f"  {description}"]
         if evidence:
-            print(f"  Evidence: {evidence}")
-        print()
+            if not isinstance(evidence, str):
+                evidence = ', '.join(f'{key}: {json.dumps(value)}' for key, value in evidence.items())
+            lines.append(f"  Evidence: {evidence}")
+        
+        # Tests run concurrently; keep each finding's record and console block together
+        with self._findings_lock:
+            self.findings.append(finding)
+            if self.findings_log:
+                if self._findings_fp is None:
+                    self._findings_fp = open(self.findings_log, 'wb')
+                self._findings_fp.write(_json_dumps(finding._asdict()) + b'\n')
+                self._findings_fp.flush()
+            print("\n".join(lines) + "\n\n", end="")
     
-    def make_graphql_request(self, query: str, variables: Dict = None, headers: Dict = None) -> requests.Response:
-        """Make a GraphQL request"""
+    def make_graphql_request(self, query: str, variables: Dict = None, headers: Dict = None,
+                             timeout: Optional[float] = None) -> Optional[requests.Response]:
+        """Make a GraphQL request
+        
+        Returns None when the request fails (timeout, connection error), so one slow probe does
+        not abort the rest of its category.
+        """
         payload = {
             'query': query,
             'variables': variables or {}
         }
         
-        request_headers = self.session.headers.copy()
-        if headers:
-            request_headers.update(headers)
+        # Per-request headers are merged over the session defaults by requests itself
+        try:
+            return self.session.post(self.graphql_url, data=_json_dumps(payload), headers=headers,
+                                     timeout=timeout or self.timeout)
+        except requests.RequestException as e:
+            print(f"⚠️  Request failed: {e}\n", end="")
+            return None
+    
+    def make_persisted_request(self, query: str, query_hash: str, variables: Dict = None) -> Optional[requests.Response]:
+        """Make a GraphQL request through Automatic Persisted Queries
         
-        return self.session.post(self.graphql_url, json=payload, headers=request_headers)
+        The first call registers the document with the router; later calls send only its hash,
+        letting the router skip parsing and planning. Falls back to a plain request when APQ is
+        not supported, and re-registers when the router has evicted the hash. Returns None when
+        the request fails.
+        """
+        extensions = {'persistedQuery': {'version': 1, 'sha256Hash': query_hash}}
+        
+        try:
+            if query_hash in self._persisted_hashes:
+                response = self.session.post(
+                    self.graphql_url,
+                    data=_json_dumps({'variables': variables or {}, 'extensions': extensions}),
+                    timeout=self.timeout
+                )
+                if b'PERSISTED_QUERY_NOT_FOUND' not in response.content:
+                    return response
+                self._persisted_hashes.discard(query_hash)
+            
+            response = self.session.post(
+                self.graphql_url,
+                data=_json_dumps({'query': query, 'variables': variables or {}, 'extensions': extensions}),
+                timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            print(f"⚠️  Request failed: {e}\n", end="")
+            return None
+        
+        if b'PERSISTED_QUERY_NOT_SUPPORTED' in response.content:
+            return self.make_graphql_request(query, variables)
+        if response.status_code == 200:
+            self._persisted_hashes.add(query_hash)
+        return response
+    
+    def make_graphql_batch(self, operations: List[Tuple[str, Optional[Dict]]]) -> List[Optional[Dict]]:
+        """Send several operations in one HTTP request using GraphQL query batching
+        
+        Returns the parsed response body per operation (None if it failed). Falls back to
+        individual concurrent requests when batching is not enabled on the router or the
+        batched request itself fails.
+        """
+        payload = [{'query': query, 'variables': variables or {}} for query, variables in operations]
+        try:
+            response = self.session.post(self.graphql_url, data=_json_dumps(payload), timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"⚠️  Batched request failed, sending operations one by one: {e}\n", end="")
+            response = None
+        
+        if response is not None and response.status_code == 200:
+            try:
+                results = _json_loads(response.content)
+                if isinstance(results, list) and len(results) == len(operations):
+                    return results
+            except json.JSONDecodeError:
+                pass
+        
+        return self.fan_out(lambda operation: self._parse_body(self.make_graphql_request(*operation)), operations)
+    
+    @staticmethod
+    def _read_capped(response: requests.Response) -> bytes:
+        """Body of a streamed response, truncated at MAX_RESPONSE_BYTES"""
+        with response:
+            return b''.join(islice(response.iter_content(_READ_CHUNK), MAX_RESPONSE_BYTES // _READ_CHUNK))
+    
+    @staticmethod
+    def _parse_body(response: Optional[requests.Response]) -> Optional[Dict]:
+        """Parsed JSON body of a successful response, or None"""
+        if response is None or response.status_code != 200:
+            return None
+        try:
+            return _json_loads(response.content)
+        except json.JSONDecodeError:
+            return None
+    
+    def fan_out(self, probe, items) -> List[Any]:
+        """Run independent I/O-bound probes concurrently, returning results in input order"""
+        items = list(items)
+        if len(items) < 2:
+            return [probe(item) for item in items]
+        with ThreadPoolExecutor(max_workers=len(items)) as executor:
+            return list(executor.map(probe, items))
     
     def test_a01_broken_access_control(self):
         """A01:2021 – Broken Access Control"""
-        print("🔍 Testing A01:2021 – Broken Access Control")
+        print("🔍 Testing A01:2021 – Broken Access Control\n", end="")
         
         # Test 1: Vertical privilege escalation
         admin_query = """
@@ -95,9 +468,9 @@ class OWASPTop10Tester:
         
         response = self.make_graphql_request(admin_query, variables)
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'data' in data and data['data'].get('moderateReview'):
                     self.log_finding(
                         'A01:2021',
@@ -129,9 +502,9 @@ class OWASPTop10Tester:
         variables = {"userId": "660e8400-e29b-41d4-a716-446655440999"}
         response = self.make_graphql_request(other_user_data_query, variables)
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'data' in data and data['data'].get('user'):
                     user_data = data['data']['user']
                     sensitive_fields = ['email', 'phone', 'address', 'paymentMethods']
@@ -170,15 +543,10 @@ class OWASPTop10Tester:
         ]
         
         accessible_reviews = 0
-        for review_id in test_ids:
-            response = self.make_graphql_request(direct_access_query, {"id": review_id})
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if 'data' in data and data['data'].get('review'):
-                        accessible_reviews += 1
-                except json.JSONDecodeError:
-                    pass
+        results = self.make_graphql_batch([(direct_access_query, {"id": review_id}) for review_id in test_ids])
+        for data in results:
+            if data and 'data' in data and data['data'].get('review'):
+                accessible_reviews += 1
         
         if accessible_reviews > 0:
             self.log_finding(
@@ -191,7 +559,7 @@ class OWASPTop10Tester:
     
     def test_a02_cryptographic_failures(self):
         """A02:2021 – Cryptographic Failures"""
-        print("🔍 Testing A02:2021 – Cryptographic Failures")
+        print("🔍 Testing A02:2021 – Cryptographic Failures\n", end="")
         
         # Test 1: Check if HTTPS is enforced
         if self.base_url.startswith('http://'):
@@ -204,26 +572,19 @@ class OWASPTop10Tester:
             )
         
         # Test 2: Weak JWT implementation
-        if self.auth_token:
-            try:
-                parts = self.auth_token.split('.')
-                if len(parts) == 3:
-                    header = json.loads(base64.urlsafe_b64decode(parts[0] + '=='))
-                    
-                    # Check for weak algorithms
-                    alg = header.get('alg', '').upper()
-                    weak_algorithms = ['NONE', 'HS256']  # HS256 can be weak if secret is compromised
-                    
-                    if alg in weak_algorithms:
-                        self.log_finding(
-                            'A02:2021',
-                            'MEDIUM',
-                            'Weak JWT Algorithm',
-                            f'JWT uses potentially weak algorithm: {alg}',
-                            f'Algorithm: {alg}'
-                        )
-            except Exception:
-                pass
+        if self._jwt_header:
+            # Check for weak algorithms
+            alg = str(self._jwt_header.get('alg', '')).upper()
+            weak_algorithms = ['NONE', 'HS256']  # HS256 can be weak if secret is compromised
+            
+            if alg in weak_algorithms:
+                self.log_finding(
+                    'A02:2021',
+                    'MEDIUM',
+                    'Weak JWT Algorithm',
+                    f'JWT uses potentially weak algorithm: {alg}',
+                    f'Algorithm: {alg}'
+                )
         
         # Test 3: Password storage (if applicable)
         password_test_mutation = """
@@ -243,9 +604,9 @@ class OWASPTop10Tester:
         
         response = self.make_graphql_request(password_test_mutation, variables)
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'data' in data and data['data'].get('changePassword', {}).get('success'):
                     self.log_finding(
                         'A02:2021',
@@ -259,107 +620,49 @@ class OWASPTop10Tester:
     
     def test_a03_injection(self):
         """A03:2021 – Injection"""
-        print("🔍 Testing A03:2021 – Injection")
+        print("🔍 Testing A03:2021 – Injection\n", end="")
         
         # Test 1: SQL Injection
-        sql_payloads = [
-            "' OR '1'='1' --",
-            "'; DROP TABLE reviews; --",
-            "' UNION SELECT password FROM users --",
-            "1' OR 1=1 --"
-        ]
-        
-        for payload in sql_payloads:
-            query = """
-            query SQLInjectionTest($id: ID!) {
-              review(id: $id) {
-                id
-                text
-              }
-            }
-            """
-            
-            response = self.make_graphql_request(query, {"id": payload})
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    response_text = json.dumps(data).lower()
-                    
-                    # Check for SQL error indicators
-                    sql_errors = ['syntax error', 'mysql', 'postgresql', 'sql server', 'ora-']
-                    for error in sql_errors:
-                        if error in response_text:
-                            self.log_finding(
-                                'A03:2021',
-                                'CRITICAL',
-                                'SQL Injection Vulnerability',
-                                f'SQL injection detected with payload: {payload}',
-                                f'Error indicator: {error}'
-                            )
-                            break
-                except json.JSONDecodeError:
-                    pass
+        results = self.make_graphql_batch([(SQL_TEST_QUERY, {"id": payload}) for payload in SQL_PAYLOADS])
+        for payload, data in zip(SQL_PAYLOADS, results):
+            if isinstance(data, dict):
+                # Database errors surface in the error messages; search those strings as they are
+                match = next(filter(None, (
+                    SQL_ERROR_RE.search(str(error.get('message', ''))) for error in data.get('errors') or ()
+                    if isinstance(error, dict)
+                )), None)
+                if match:
+                    self.log_finding(
+                        'A03:2021',
+                        'CRITICAL',
+                        'SQL Injection Vulnerability',
+                        f'SQL injection detected with payload: {payload}',
+                        f'Error indicator: {match.group(0).lower()}'
+                    )
         
         # Test 2: NoSQL Injection
-        nosql_payloads = [
-            {"$ne": None},
-            {"$regex": ".*"},
-            {"$where": "1==1"},
-            {"$gt": ""}
-        ]
-        
-        for payload in nosql_payloads:
-            query = """
-            query NoSQLInjectionTest($filter: ReviewsFilter) {
-              reviews(filter: $filter, first: 10) {
-                edges {
-                  node {
-                    id
-                  }
-                }
-              }
-            }
-            """
-            
-            response = self.make_graphql_request(query, {"filter": payload})
-            
-            if response.status_code == 200:
+        responses = self.fan_out(lambda payload: self.make_graphql_request(NOSQL_TEST_QUERY, {"filter": payload}), NOSQL_PAYLOADS)
+        for payload, response in zip(NOSQL_PAYLOADS, responses):
+            if response is not None and response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     if 'data' in data and data['data'].get('reviews', {}).get('edges'):
                         self.log_finding(
                             'A03:2021',
                             'HIGH',
                             'NoSQL Injection Vulnerability',
                             f'NoSQL injection payload returned data: {payload}',
-                            f'Payload: {json.dumps(payload)}'
+                            {'Payload': payload}
                         )
                 except json.JSONDecodeError:
                     pass
         
         # Test 3: GraphQL Injection
-        graphql_injection_payloads = [
-            '") { id } user(id: "1',
-            '") { password } user(id: "1',
-            '") { __schema { types { name } } } user(id: "1'
-        ]
-        
-        for payload in graphql_injection_payloads:
-            malicious_query = f"""
-            query GraphQLInjectionTest {{
-              user(id: "{payload}") {{
-                id
-                name
-              }}
-            }}
-            """
-            
-            response = self.make_graphql_request(malicious_query)
-            
-            if response.status_code == 200:
+        responses = self.fan_out(self.make_graphql_request, GRAPHQL_INJECTION_QUERIES)
+        for payload, response in zip(GRAPHQL_INJECTION_PAYLOADS, responses):
+            if response is not None and response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     if 'data' in data and ('password' in str(data) or '__schema' in str(data)):
                         self.log_finding(
                             'A03:2021',
@@ -373,7 +676,7 @@ class OWASPTop10Tester:
     
     def test_a04_insecure_design(self):
         """A04:2021 – Insecure Design"""
-        print("🔍 Testing A04:2021 – Insecure Design")
+        print("🔍 Testing A04:2021 – Insecure Design\n", end="")
         
         # Test 1: Business logic flaws
         # Test creating multiple reviews for the same offer by the same user
@@ -401,9 +704,9 @@ class OWASPTop10Tester:
             
             response = self.make_graphql_request(create_review_mutation, variables)
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     if 'data' in data and data['data'].get('createReview'):
                         successful_reviews += 1
                 except json.JSONDecodeError:
@@ -419,11 +722,6 @@ class OWASPTop10Tester:
             )
         
         # Test 2: Race condition in review creation
-        import threading
-        import time
-        
-        race_condition_results = []
-        
         def create_review_thread():
             variables = {
                 "input": {
@@ -433,21 +731,12 @@ class OWASPTop10Tester:
                 }
             }
             response = self.make_graphql_request(create_review_mutation, variables)
-            race_condition_results.append(response.status_code == 200)
-        
-        # Start multiple threads simultaneously
-        threads = []
-        for _ in range(5):
-            thread = threading.Thread(target=create_review_thread)
-            threads.append(thread)
+            return response is not None and response.status_code == 200
         
-        # Start all threads at once
-        for thread in threads:
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # Fire all attempts at once over the pooled session
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(create_review_thread) for _ in range(5)]
+            race_condition_results = [future.result() for future in as_completed(futures)]
         
         successful_concurrent_reviews = sum(race_condition_results)
         if successful_concurrent_reviews > 1:
@@ -461,68 +750,61 @@ class OWASPTop10Tester:
     
     def test_a05_security_misconfiguration(self):
         """A05:2021 – Security Misconfiguration"""
-        print("🔍 Testing A05:2021 – Security Misconfiguration")
+        print("🔍 Testing A05:2021 – Security Misconfiguration\n", end="")
         
         # Test 1: GraphQL introspection enabled
-        introspection_query = """
-        query IntrospectionQuery {
-          __schema {
-            queryType { name }
-            mutationType { name }
-            types { name }
-          }
-        }
-        """
-        
-        response = self.make_graphql_request(introspection_query)
-        
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if 'data' in data and '__schema' in data['data']:
-                    self.log_finding(
-                        'A05:2021',
-                        'MEDIUM',
-                        'GraphQL Introspection Enabled',
-                        'GraphQL introspection is enabled in production',
-                        f'Schema types exposed: {len(data["data"]["__schema"]["types"])}'
-                    )
-            except json.JSONDecodeError:
-                pass
+        # The schema can run to megabytes; only the type count is needed, so scan at most
+        # MAX_RESPONSE_BYTES of raw bytes. `types` is the last selection, so every "name"
+        # after it belongs to a type.
+        raw = None
+        try:
+            response = self.session.post(
+                self.graphql_url,
+                data=_json_dumps({'query': INTROSPECTION_QUERY, 'variables': {}}),
+                timeout=self.timeout,
+                stream=True
+            )
+            if response.status_code != 200:
+                response.close()
+            else:
+                raw = self._read_capped(response)
+        except requests.RequestException as e:
+            print(f"⚠️  Request failed: {e}\n", end="")
+        
+        if raw is not None:
+            schema = SCHEMA_OBJECT_RE.search(raw)
+            if schema:
+                types_start = raw.find(b'"types"', schema.end())
+                type_count = raw.count(b'"name"', types_start) if types_start != -1 else 0
+                self.log_finding(
+                    'A05:2021',
+                    'MEDIUM',
+                    'GraphQL Introspection Enabled',
+                    'GraphQL introspection is enabled in production',
+                    f'Schema types exposed: {type_count}'
+                )
         
         # Test 2: Verbose error messages
         invalid_query = "query { nonExistentField }"
         response = self.make_graphql_request(invalid_query)
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'errors' in data:
                     for error in data['errors']:
-                        error_message = error.get('message', '').lower()
-                        sensitive_info = ['database', 'internal', 'server', 'path', 'file']
-                        
-                        for info in sensitive_info:
-                            if info in error_message:
-                                self.log_finding(
-                                    'A05:2021',
-                                    'LOW',
-                                    'Information Disclosure in Error Messages',
-                                    'Error messages contain sensitive information',
-                                    f'Error: {error["message"]}'
-                                )
-                                break
+                        if VERBOSE_ERROR_RE.search(error.get('message', '')):
+                            self.log_finding(
+                                'A05:2021',
+                                'LOW',
+                                'Information Disclosure in Error Messages',
+                                'Error messages contain sensitive information',
+                                f'Error: {error["message"]}'
+                            )
             except json.JSONDecodeError:
                 pass
         
         # Test 3: Default credentials (if applicable)
-        default_creds = [
-            ("admin", "admin"),
-            ("admin", "password"),
-            ("root", "root"),
-            ("test", "test")
-        ]
-        
         login_mutation = """
         mutation Login($username: String!, $password: String!) {
           login(username: $username, password: $password) {
@@ -535,78 +817,62 @@ class OWASPTop10Tester:
         }
         """
         
-        for username, password in default_creds:
-            variables = {"username": username, "password": password}
-            response = self.make_graphql_request(login_mutation, variables)
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if 'data' in data and data['data'].get('login', {}).get('token'):
-                        self.log_finding(
-                            'A05:2021',
-                            'CRITICAL',
-                            'Default Credentials',
-                            f'Default credentials work: {username}/{password}',
-                            f'User roles: {data["data"]["login"]["user"]["roles"]}'
-                        )
-                except json.JSONDecodeError:
-                    pass
+        results = self.make_graphql_batch([
+            (login_mutation, {"username": username, "password": password})
+            for username, password in DEFAULT_CREDS
+        ])
+        for (username, password), data in zip(DEFAULT_CREDS, results):
+            if data and 'data' in data and data['data'].get('login', {}).get('token'):
+                self.log_finding(
+                    'A05:2021',
+                    'CRITICAL',
+                    'Default Credentials',
+                    f'Default credentials work: {username}/{password}',
+                    f'User roles: {data["data"]["login"]["user"]["roles"]}'
+                )
     
     def test_a06_vulnerable_components(self):
         """A06:2021 – Vulnerable and Outdated Components"""
-        print("🔍 Testing A06:2021 – Vulnerable and Outdated Components")
+        print("🔍 Testing A06:2021 – Vulnerable and Outdated Components\n", end="")
         
         # Test 1: Check server headers for version information
-        response = self.session.get(self.base_url)
-        
-        server_header = response.headers.get('Server', '')
-        if server_header:
-            # Check for known vulnerable versions (simplified check)
-            vulnerable_patterns = [
-                'nginx/1.14',  # Example of potentially outdated version
-                'Apache/2.2',  # Very old Apache version
-                'Express',     # Exposing framework information
-            ]
-            
-            for pattern in vulnerable_patterns:
-                if pattern in server_header:
-                    self.log_finding(
-                        'A06:2021',
-                        'MEDIUM',
-                        'Server Version Disclosure',
-                        f'Server header exposes potentially vulnerable version: {server_header}',
-                        f'Server: {server_header}'
-                    )
-                    break
+        try:
+            server_header = self.session.get(self.base_url, timeout=self.timeout).headers.get('Server', '')
+        except requests.RequestException as e:
+            print(f"⚠️  Request failed: {e}\n", end="")
+            server_header = ''
+        
+        # Check for known vulnerable versions (simplified check)
+        if server_header and any(pattern in server_header for pattern in VULN_SERVER_PATTERNS):
+            self.log_finding(
+                'A06:2021',
+                'MEDIUM',
+                'Server Version Disclosure',
+                f'Server header exposes potentially vulnerable version: {server_header}',
+                f'Server: {server_header}'
+            )
         
         # Test 2: Check for common vulnerable endpoints
-        vulnerable_endpoints = [
-            '/admin',
-            '/debug',
-            '/test',
-            '/api/v1',
-            '/graphiql',
-            '/playground'
-        ]
-        
-        for endpoint in vulnerable_endpoints:
+        def endpoint_probe(endpoint):
             try:
-                response = self.session.get(urljoin(self.base_url, endpoint))
-                if response.status_code == 200:
-                    self.log_finding(
-                        'A06:2021',
-                        'LOW',
-                        'Exposed Development Endpoint',
-                        f'Development/admin endpoint is accessible: {endpoint}',
-                        f'Status: {response.status_code}'
-                    )
+                return self.session.get(f'{self.base_url}{endpoint}', timeout=self.timeout)
             except requests.RequestException:
-                pass
+                return None
+        
+        responses = self.fan_out(endpoint_probe, VULN_ENDPOINTS)
+        for endpoint, response in zip(VULN_ENDPOINTS, responses):
+            if response is not None and response.status_code == 200:
+                self.log_finding(
+                    'A06:2021',
+                    'LOW',
+                    'Exposed Development Endpoint',
+                    f'Development/admin endpoint is accessible: {endpoint}',
+                    f'Status: {response.status_code}'
+                )
     
     def test_a07_identification_authentication_failures(self):
         """A07:2021 – Identification and Authentication Failures"""
-        print("🔍 Testing A07:2021 – Identification and Authentication Failures")
+        print("🔍 Testing A07:2021 – Identification and Authentication Failures\n", end="")
         
         # Test 1: Brute force protection
         login_mutation = """
@@ -619,17 +885,17 @@ class OWASPTop10Tester:
         
         # Attempt multiple failed logins
         failed_attempts = 0
-        for i in range(10):
+        for attempt, password in enumerate(BRUTE_FORCE_PASSWORDS, 1):
             variables = {
                 "username": "testuser",
-                "password": f"wrongpassword{i}"
+                "password": password
             }
             
             response = self.make_graphql_request(login_mutation, variables)
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     if 'errors' in data:
                         failed_attempts += 1
                     elif 'data' in data and data['data'].get('login', {}).get('token'):
@@ -639,15 +905,24 @@ class OWASPTop10Tester:
                             'CRITICAL',
                             'Authentication Bypass',
                             'Login succeeded with incorrect password',
-                            f'Password: wrongpassword{i}'
+                            f'Password: {password}'
                         )
                         break
                 except json.JSONDecodeError:
                     pass
-            
-            time.sleep(0.1)  # Small delay between attempts
+            elif response is not None and response.status_code == 429:
+                # Being throttled is the protection this test looks for; waiting out Retry-After
+                # would only stall the audit
+                self.log_finding(
+                    'A07:2021',
+                    'INFO',
+                    'Brute Force Protection Detected',
+                    'Repeated failed logins are rate limited (good security practice)',
+                    f'Rate limited after {attempt} login attempts'
+                )
+                break
         
-        if failed_attempts == 10:
+        if failed_attempts == len(BRUTE_FORCE_PASSWORDS):
             self.log_finding(
                 'A07:2021',
                 'MEDIUM',
@@ -667,64 +942,56 @@ class OWASPTop10Tester:
             test_query = "query { __typename }"
             response = self.make_graphql_request(test_query)
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 try:
-                    data = response.json()
-                    if 'data' in data:
+                    data = _json_loads(response.content)
+                    if 'data' in data and self._jwt_payload:
                         # Token still works - check if it has proper expiration
                         try:
-                            parts = self.auth_token.split('.')
-                            if len(parts) == 3:
-                                payload = json.loads(base64.urlsafe_b64decode(parts[1] + '=='))
-                                exp = payload.get('exp', 0)
-                                current_time = time.time()
-                                
-                                # Check if token expires in more than 24 hours
-                                if exp - current_time > 86400:  # 24 hours
-                                    self.log_finding(
-                                        'A07:2021',
-                                        'MEDIUM',
-                                        'Long Token Expiration',
-                                        'JWT tokens have very long expiration times',
-                                        f'Token expires in {(exp - current_time) / 3600:.1f} hours'
-                                    )
-                        except Exception:
+                            exp = float(self._jwt_payload.get('exp', 0))
+                            current_time = time.time()
+                            
+                            # Check if token expires in more than 24 hours
+                            if exp - current_time > 86400:  # 24 hours
+                                self.log_finding(
+                                    'A07:2021',
+                                    'MEDIUM',
+                                    'Long Token Expiration',
+                                    'JWT tokens have very long expiration times',
+                                    f'Token expires in {(exp - current_time) / 3600:.1f} hours'
+                                )
+                        except (TypeError, ValueError):
                             pass
                 except json.JSONDecodeError:
                     pass
     
     def test_a08_software_data_integrity_failures(self):
         """A08:2021 – Software and Data Integrity Failures"""
-        print("🔍 Testing A08:2021 – Software and Data Integrity Failures")
+        print("🔍 Testing A08:2021 – Software and Data Integrity Failures\n", end="")
         
         # Test 1: JWT signature verification
-        if self.auth_token:
+        if self._jwt_parts:
             try:
-                parts = self.auth_token.split('.')
-                if len(parts) == 3:
-                    # Modify the signature
-                    modified_signature = base64.urlsafe_b64encode(b'modified_signature').decode().rstrip('=')
-                    modified_token = f"{parts[0]}.{parts[1]}.{modified_signature}"
-                    
-                    test_query = "query { __typename }"
-                    response = self.make_graphql_request(
-                        test_query,
-                        headers={'Authorization': f'Bearer {modified_token}'}
+                # Modify the signature
+                modified_token = f"{self._jwt_parts[0]}.{self._jwt_parts[1]}.{_TAMPERED_SIGNATURE}"
+                
+                response = self.session.post(
+                    self.graphql_url,
+                    data=_TYPENAME_BODY,
+                    headers={'Authorization': f'Bearer {modified_token}'},
+                    timeout=self.timeout
+                )
+                
+                # Only acceptance matters, so inspect the raw body instead of parsing it
+                if (response.status_code == 200 and b'"data"' in response.content
+                        and b'"errors"' not in response.content):
+                    self.log_finding(
+                        'A08:2021',
+                        'CRITICAL',
+                        'JWT Signature Not Verified',
+                        'Modified JWT tokens are accepted without signature verification',
+                        'Modified signature accepted'
                     )
-                    
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
-                            if 'data' in data:
-                                self.log_finding(
-                                    'A08:2021',
-                                    'CRITICAL',
-                                    'JWT Signature Not Verified',
-                                    'Modified JWT tokens are accepted without signature verification',
-                                    'Modified signature accepted'
-                                )
-                        except json.JSONDecodeError:
-                            pass
             except Exception:
                 pass
         
@@ -750,9 +1017,9 @@ class OWASPTop10Tester:
         
         response = self.make_graphql_request(create_review_mutation, variables)
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'data' in data and data['data'].get('createReview'):
                     review = data['data']['createReview']
                     if review.get('rating') == 10:
@@ -768,7 +1035,7 @@ class OWASPTop10Tester:
     
     def test_a09_security_logging_monitoring_failures(self):
         """A09:2021 – Security Logging and Monitoring Failures"""
-        print("🔍 Testing A09:2021 – Security Logging and Monitoring Failures")
+        print("🔍 Testing A09:2021 – Security Logging and Monitoring Failures\n", end="")
         
         # Test 1: Check if security events are logged
         # This is difficult to test externally, but we can check for indicators
@@ -786,22 +1053,35 @@ class OWASPTop10Tester:
             # We can only check if the system responds appropriately
         
         # Test 2: Rate limiting response (indicates monitoring)
-        rapid_requests = 0
-        for i in range(50):
-            response = self.make_graphql_request("query { __typename }")
-            if response.status_code == 429:  # Rate limited
-                self.log_finding(
-                    'A09:2021',
-                    'INFO',
-                    'Rate Limiting Detected',
-                    'System has rate limiting in place (good security practice)',
-                    f'Rate limited after {i} requests'
-                )
-                break
-            rapid_requests += 1
-            time.sleep(0.01)
+        # Register the probe once, then fire a single prepared request as one concurrent burst,
+        # which is the traffic pattern a rate limiter is meant to catch
+        self.make_persisted_request(TYPENAME_QUERY, TYPENAME_QUERY_HASH)
+        if TYPENAME_QUERY_HASH in self._persisted_hashes:
+            body = {'variables': {}, 'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': TYPENAME_QUERY_HASH}}}
+        else:
+            body = {'query': TYPENAME_QUERY, 'variables': {}}
+        prepared = self.session.prepare_request(requests.Request('POST', self.graphql_url, data=_json_dumps(body)))
+        
+        # All requests leave together, so bounding each one by the burst budget bounds the probe;
+        # unanswered requests make the result inconclusive rather than stretching the scan
+        def burst_probe(_):
+            try:
+                return self.session.send(prepared, timeout=RATE_LIMIT_DEADLINE).status_code
+            except requests.RequestException:
+                return None
         
-        if rapid_requests == 50:
+        statuses = self.fan_out(burst_probe, range(50))
+        rate_limited = statuses.count(429)
+        
+        if rate_limited:
+            self.log_finding(
+                'A09:2021',
+                'INFO',
+                'Rate Limiting Detected',
+                'System has rate limiting in place (good security practice)',
+                f'Rate limited {rate_limited} of {len(statuses)} concurrent requests'
+            )
+        elif None not in statuses:
             self.log_finding(
                 'A09:2021',
                 'MEDIUM',
@@ -812,108 +1092,76 @@ class OWASPTop10Tester:
     
     def test_a10_server_side_request_forgery(self):
         """A10:2021 – Server-Side Request Forgery (SSRF)"""
-        print("🔍 Testing A10:2021 – Server-Side Request Forgery (SSRF)")
-        
-        # Test 1: URL-based SSRF
-        ssrf_payloads = [
-            "http://localhost:22",  # SSH port
-            "http://127.0.0.1:3306",  # MySQL port
-            "http://169.254.169.254/latest/meta-data/",  # AWS metadata
-            "file:///etc/passwd",  # Local file access
-            "http://internal-service:8080",  # Internal service
-        ]
+        print("🔍 Testing A10:2021 – Server-Side Request Forgery (SSRF)\n", end="")
         
-        # Test if there are any fields that accept URLs
-        url_test_mutation = """
-        mutation UpdateProfile($input: UpdateProfileInput!) {
-          updateProfile(input: $input) {
-            id
-            avatarUrl
-          }
-        }
-        """
-        
-        for payload in ssrf_payloads:
-            variables = {
-                "input": {
-                    "avatarUrl": payload
-                }
-            }
-            
-            start_time = time.time()
-            response = self.make_graphql_request(url_test_mutation, variables)
-            end_time = time.time()
-            
-            # Check for SSRF indicators
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if 'errors' in data:
-                        for error in data['errors']:
-                            error_message = error.get('message', '').lower()
-                            ssrf_indicators = [
-                                'connection refused', 'timeout', 'unreachable',
-                                'internal server', 'network error'
-                            ]
-                            
-                            for indicator in ssrf_indicators:
-                                if indicator in error_message:
-                                    self.log_finding(
-                                        'A10:2021',
-                                        'HIGH',
-                                        'Server-Side Request Forgery (SSRF)',
-                                        f'SSRF vulnerability detected with payload: {payload}',
-                                        f'Error: {error["message"]}'
-                                    )
-                                    break
-                    
-                    # Check for time-based SSRF (long response times)
-                    if end_time - start_time > 5:
+        # Test 1: URL-based SSRF, through a field that accepts URLs
+        def check_ssrf_errors(payload, data):
+            if data and 'errors' in data:
+                for error in data['errors']:
+                    if SSRF_ERROR_RE.search(error.get('message', '')):
                         self.log_finding(
                             'A10:2021',
-                            'MEDIUM',
-                            'Potential Time-based SSRF',
-                            f'Long response time with URL payload: {payload}',
-                            f'Response time: {end_time - start_time:.2f}s'
+                            'HIGH',
+                            'Server-Side Request Forgery (SSRF)',
+                            f'SSRF vulnerability detected with payload: {payload}',
+                            f'Error: {error["message"]}'
                         )
-                        
-                except json.JSONDecodeError:
-                    pass
+        
+        def timed_probe(payload):
+            start_time = time.perf_counter()
+            response = self.make_graphql_request(
+                UPDATE_PROFILE_MUTATION, {"input": {"avatarUrl": payload}}, timeout=SSRF_TIMEOUT
+            )
+            return response, time.perf_counter() - start_time
+        
+        # Send every payload in one batched request; only a slow batch needs per-payload timing.
+        # A failed batch (timeout, refused or reset connection) is already retried per payload
+        # by make_graphql_batch, and a timed-out one also takes long enough to trigger the timing.
+        start_time = time.perf_counter()
+        results = self.make_graphql_batch([
+            (UPDATE_PROFILE_MUTATION, {"input": {"avatarUrl": payload}}) for payload in SSRF_PAYLOADS
+        ])
+        batch_time = time.perf_counter() - start_time
+        
+        for payload, data in zip(SSRF_PAYLOADS, results):
+            check_ssrf_errors(payload, data)
+        
+        if batch_time > 5:
+            # Check for time-based SSRF (long response times), probing every URL concurrently with
+            # its own timer so the slowest payload bounds the wall time
+            timed = self.fan_out(timed_probe, SSRF_PAYLOADS)
+            for index, (payload, (response, elapsed)) in enumerate(zip(SSRF_PAYLOADS, timed)):
+                # Successful mutations carry no errors; only parse bodies that can hold an indicator
+                if (results[index] is None and response is not None
+                        and b'"errors"' in response.content):
+                    check_ssrf_errors(payload, self._parse_body(response))
+                if elapsed > 5:
+                    self.log_finding(
+                        'A10:2021',
+                        'MEDIUM',
+                        'Potential Time-based SSRF',
+                        f'Long response time with URL payload: {payload}',
+                        f'Response time: {elapsed:.2f}s'
+                    )
     
     def generate_owasp_report(self) -> Dict[str, Any]:
         """Generate OWASP Top 10 compliance report"""
         
-        # Group findings by OWASP category
-        owasp_categories = {}
-        for finding in self.findings:
+        findings = [finding._asdict() for finding in self.findings]
+        
+        # Group findings by OWASP category, collecting the critical/high ones in the same pass
+        owasp_categories = defaultdict(list)
+        critical_high_counts = defaultdict(int)
+        for finding in findings:
             category = finding['owasp_category']
-            if category not in owasp_categories:
-                owasp_categories[category] = []
             owasp_categories[category].append(finding)
+            if finding['severity'] in HIGH_SEVERITIES:
+                critical_high_counts[category] += 1
+        categories_with_issues = set(critical_high_counts)
         
         # Calculate compliance score
-        total_categories = 10
-        compliant_categories = 0
-        
-        category_names = {
-            'A01:2021': 'Broken Access Control',
-            'A02:2021': 'Cryptographic Failures',
-            'A03:2021': 'Injection',
-            'A04:2021': 'Insecure Design',
-            'A05:2021': 'Security Misconfiguration',
-            'A06:2021': 'Vulnerable and Outdated Components',
-            'A07:2021': 'Identification and Authentication Failures',
-            'A08:2021': 'Software and Data Integrity Failures',
-            'A09:2021': 'Security Logging and Monitoring Failures',
-            'A10:2021': 'Server-Side Request Forgery (SSRF)'
-        }
-        
-        for category in category_names.keys():
-            category_findings = owasp_categories.get(category, [])
-            critical_high_findings = [f for f in category_findings if f['severity'] in ['CRITICAL', 'HIGH']]
-            
-            if not critical_high_findings:
-                compliant_categories += 1
+        total_categories = len(OWASP_CATEGORY_NAMES)
+        compliant_categories = len(OWASP_CATEGORY_NAMES.keys() - categories_with_issues)
         
         compliance_score = (compliant_categories / total_categories) * 100
         
@@ -923,95 +1171,24 @@ class OWASPTop10Tester:
             'owasp_compliance_score': compliance_score,
             'compliant_categories': compliant_categories,
             'total_categories': total_categories,
-            'findings_by_category': owasp_categories,
-            'category_names': category_names,
-            'total_findings': len(self.findings),
-            'findings': self.findings,
-            'recommendations': self.generate_owasp_recommendations()
+            'findings_by_category': dict(owasp_categories),
+            'critical_high_counts': dict(critical_high_counts),
+            'category_names': OWASP_CATEGORY_NAMES,
+            'total_findings': len(findings),
+            'findings': findings,
+            'recommendations': self.generate_owasp_recommendations(categories_with_issues)
         }
         
         return report
     
-    def generate_owasp_recommendations(self) -> List[str]:
-        """Generate OWASP-specific recommendations"""
+    def generate_owasp_recommendations(self, categories_with_issues: Set[str]) -> List[str]:
+        """Generate OWASP-specific recommendations for the categories with critical/high findings"""
         recommendations = []
         
-        # Check which categories have issues
-        categories_with_issues = set()
-        for finding in self.findings:
-            if finding['severity'] in ['CRITICAL', 'HIGH']:
-                categories_with_issues.add(finding['owasp_category'])
-        
         # Category-specific recommendations
-        if 'A01:2021' in categories_with_issues:
-            recommendations.extend([
-                "🔒 Implement proper access control checks for all operations",
-                "🔐 Use role-based access control (RBAC) consistently",
-                "🛡️ Validate user permissions at the API level"
-            ])
-        
-        if 'A02:2021' in categories_with_issues:
-            recommendations.extend([
-                "🔐 Enforce HTTPS for all communications",
-                "🔑 Use strong cryptographic algorithms (AES-256, RSA-2048+)",
-                "🛡️ Implement proper key management"
-            ])
-        
-        if 'A03:2021' in categories_with_issues:
-            recommendations.extend([
-                "💉 Use parameterized queries to prevent SQL injection",
-                "🛡️ Implement input validation and sanitization",
-                "🔍 Use GraphQL query complexity analysis"
-            ])
-        
-        if 'A04:2021' in categories_with_issues:
-            recommendations.extend([
-                "🏗️ Implement proper business logic validation",
-                "🔄 Add concurrency controls for critical operations",
-                "📋 Conduct threat modeling for business processes"
-            ])
-        
-        if 'A05:2021' in categories_with_issues:
-            recommendations.extend([
-                "⚙️ Disable GraphQL introspection in production",
-                "🔧 Remove verbose error messages",
-                "🛡️ Implement security headers and configurations"
-            ])
-        
-        if 'A06:2021' in categories_with_issues:
-            recommendations.extend([
-                "📦 Keep all dependencies up to date",
-                "🔍 Regular vulnerability scanning of components",
-                "🚫 Remove unused dependencies and features"
-            ])
-        
-        if 'A07:2021' in categories_with_issues:
-            recommendations.extend([
-                "🔐 Implement strong authentication mechanisms",
-                "🛡️ Add brute force protection",
-                "⏰ Use appropriate session timeouts"
-            ])
-        
-        if 'A08:2021' in categories_with_issues:
-            recommendations.extend([
-                "✅ Implement JWT signature verification",
-                "🔍 Add data integrity checks",
-                "🛡️ Use secure software update mechanisms"
-            ])
-        
-        if 'A09:2021' in categories_with_issues:
-            recommendations.extend([
-                "📊 Implement comprehensive security logging",
-                "🚨 Set up security monitoring and alerting",
-                "📈 Monitor for suspicious activities"
-            ])
-        
-        if 'A10:2021' in categories_with_issues:
-            recommendations.extend([
-                "🌐 Validate and sanitize all URLs",
-                "🚫 Implement URL whitelist for external requests",
-                "🔒 Use network segmentation to limit SSRF impact"
-            ])
+        for category, category_recommendations in OWASP_RECOMMENDATIONS.items():
+            if category in categories_with_issues:
+                recommendations.extend(category_recommendations)
         
         return recommendations
     
@@ -1021,7 +1198,7 @@ class OWASPTop10Tester:
         print(f"Target: {self.base_url}")
         print("=" * 60)
         
-        # Run all OWASP Top 10 tests
+        # The categories are independent and I/O-bound, so run them concurrently
         test_methods = [
             self.test_a01_broken_access_control,
             self.test_a02_cryptographic_failures,
@@ -1031,15 +1208,26 @@ class OWASPTop10Tester:
             self.test_a06_vulnerable_components,
             self.test_a07_identification_authentication_failures,
             self.test_a08_software_data_integrity_failures,
-            self.test_a09_security_logging_monitoring_failures,
             self.test_a10_server_side_request_forgery
         ]
         
-        for test_method in test_methods:
-            try:
-                test_method()
-            except Exception as e:
-                print(f"❌ Error in {test_method.__name__}: {str(e)}")
+        with ThreadPoolExecutor(max_workers=len(test_methods)) as executor:
+            futures = {executor.submit(test_method): test_method for test_method in test_methods}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error in {futures[future].__name__}: {str(e)}")
+        
+        # The rate-limit probe runs on its own so other tests' traffic cannot skew its 429 count
+        try:
+            self.test_a09_security_logging_monitoring_failures()
+        except Exception as e:
+            print(f"❌ Error in test_a09_security_logging_monitoring_failures: {str(e)}")
+        
+        if self._findings_fp is not None:
+            self._findings_fp.close()
+            self._findings_fp = None
         
         print("=" * 60)
         print("🔒 OWASP Top 10 Security Scan Complete")
@@ -1053,10 +1241,11 @@ def main():
     parser.add_argument('url', help='Base URL of the Apollo Router')
     parser.add_argument('--token', '-t', help='JWT authentication token')
     parser.add_argument('--output', '-o', help='Output file for OWASP report (JSON)')
+    parser.add_argument('--journal', help='Write each finding to this file (NDJSON) as soon as it is found')
     
     args = parser.parse_args()
     
-    tester = OWASPTop10Tester(args.url, args.token)
+    tester = OWASPTop10Tester(args.url, args.token, args.journal)
     report = tester.run_owasp_top10_scan()
     
     # Print summary
@@ -1066,16 +1255,15 @@ def main():
     
     # Print findings by category
     for category, name in report['category_names'].items():
-        findings = report['findings_by_category'].get(category, [])
-        critical_high = [f for f in findings if f['severity'] in ['CRITICAL', 'HIGH']]
+        critical_high = report['critical_high_counts'].get(category, 0)
         
         status = "✅" if not critical_high else "❌"
-        print(f"{status} {category}: {name} ({len(critical_high)} critical/high issues)")
+        print(f"{status} {category}: {name} ({critical_high} critical/high issues)")
     
     # Save report
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(_json_dumps_pretty(report))
         print(f"📄 OWASP report saved to: {args.output}")
     
     # Exit with error code if critical issues found
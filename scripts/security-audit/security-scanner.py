@@ -11,180 +11,646 @@ This script performs comprehensive security testing including:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import os
+import re
 import time
 import argparse
+import html
 import sys
-from typing import Dict, List, Any, Optional
+import threading
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urljoin
 import base64
 import hashlib
-import random
-import string
+import hmac
+
+try:
+    # orjson encodes straight to bytes and decodes several times faster; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same
+    from orjson import dumps as _json_dumps, loads as _json_loads, OPT_INDENT_2
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return _json_dumps(obj, option=OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Response scanners: one compiled, case-insensitive alternation instead of a substring test per needle
+SQL_ERROR_RE = re.compile(
+    r'syntax error|mysql|postgresql|ora-|microsoft|driver|odbc|jdbc|sql server|sqlite|pg_|pg::', re.IGNORECASE
+)
+SENSITIVE_RE = re.compile(
+    r'database|sql|connection|server|internal|stack trace|file path|password|secret|token', re.IGNORECASE
+)
+DEPTH_LIMIT_RE = re.compile(r'depth', re.IGNORECASE)
+COMPLEXITY_LIMIT_RE = re.compile(r'complexity|cost|limit', re.IGNORECASE)
+RATE_LIMIT_RE = re.compile(r'rate|limit', re.IGNORECASE)
+AUTH_ERROR_RE = re.compile(r'unauthorized|authentication|token', re.IGNORECASE)
+
+# (connect, read) timeout for every probe; the read budget leaves room for the 10s DoS threshold
+REQUEST_TIMEOUT = (5, 30)
+
+# Color-coded console prefix per severity, built once
+SEVERITY_PREFIXES = {
+    severity: f'{color}[{severity}] '
+    for severity, color in (
+        ('CRITICAL', '\033[91m'),  # Red
+        ('HIGH', '\033[93m'),      # Yellow
+        ('MEDIUM', '\033[94m'),    # Blue
+        ('LOW', '\033[92m'),       # Green
+        ('INFO', '\033[96m'),      # Cyan
+    )
+}
+RESET_COLOR = '\033[0m'
+
+# Points each finding takes off the 100-point security score
+SEVERITY_WEIGHTS = {'CRITICAL': 10, 'HIGH': 5, 'MEDIUM': 2, 'LOW': 1, 'INFO': 0}
+
+# Full introspection results are cached per endpoint; schemas only change on deploys
+INTROSPECTION_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'security-scanner')
+INTROSPECTION_CACHE_TTL = 3600  # seconds
+SCHEMA_PROBE_QUERY = "query { __schema { queryType { name } } }"
+
+# Range of nested reviews connections searched when locating the server's depth limit
+MIN_PROBE_DEPTH = 2
+MAX_PROBE_DEPTH = 32
+
+def _build_nested_query(depth: int) -> str:
+    """Build a query with `depth` nested reviews connections, alternating author/offer links"""
+    parts = ['query DeepQuery { offers(first: 1) { edges { node { ']
+    for level in range(depth):
+        parts.append('reviews(first: 1) { edges { node { ')
+        if level < depth - 1:
+            parts.append('author { ' if level % 2 == 0 else 'offer { ')
+    # Close reviews/edges/node for every level, the links between levels, then offers/edges/node
+    parts.append('id ' + '} ' * (4 * depth + 2) + '}')
+    return ''.join(parts)
+
+def _b64url(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment, adding exactly the padding it needs"""
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+@lru_cache(maxsize=8)
+def _decode_jwt(token: str) -> Tuple[Dict, Dict]:
+    """Decode a JWT's header and claims without verifying it; cached, so callers must not mutate the result"""
+    parts = token.split('.')
+    return _json_loads(_b64url(parts[0])), _json_loads(_b64url(parts[1]))
+
+def _b64url_json(obj: Any) -> bytes:
+    """Encode a JWT header or claims object as an unpadded base64url segment"""
+    return base64.urlsafe_b64encode(_json_dumps(obj)).rstrip(b'=')
+
+# GraphQL documents used by the tests
+INTROSPECTION_QUERY = """
+query IntrospectionQuery {
+  __schema {
+    queryType { name }
+    mutationType { name }
+    subscriptionType { name }
+    types {
+      ...FullType
+    }
+    directives {
+      name
+      description
+      locations
+      args {
+        ...InputValue
+      }
+    }
+  }
+}
+
+fragment FullType on __Type {
+  kind
+  name
+  description
+  fields(includeDeprecated: true) {
+    name
+    description
+    args {
+      ...InputValue
+    }
+    type {
+      ...TypeRef
+    }
+    isDeprecated
+    deprecationReason
+  }
+  inputFields {
+    ...InputValue
+  }
+  interfaces {
+    ...TypeRef
+  }
+  enumValues(includeDeprecated: true) {
+    name
+    description
+    isDeprecated
+    deprecationReason
+  }
+  possibleTypes {
+    ...TypeRef
+  }
+}
+
+fragment InputValue on __InputValue {
+  name
+  description
+  type { ...TypeRef }
+  defaultValue
+}
+
+fragment TypeRef on __Type {
+  kind
+  name
+  ofType {
+    kind
+    name
+    ofType {
+      kind
+      name
+      ofType {
+        kind
+        name
+        ofType {
+          kind
+          name
+          ofType {
+            kind
+            name
+            ofType {
+              kind
+              name
+              ofType {
+                kind
+                name
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+COMPLEX_QUERY = """
+query ComplexQuery {
+  offers(first: 100) {
+    edges {
+      node {
+        id
+        title
+        price
+        description
+        createdAt
+        updatedAt
+        reviews(first: 50) {
+          edges {
+            node {
+              id
+              rating
+              text
+              createdAt
+              updatedAt
+              author {
+                id
+                name
+                email
+                createdAt
+                reviews(first: 20) {
+                  edges {
+                    node {
+                      id
+                      rating
+                      text
+                      createdAt
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+        seller {
+          id
+          name
+          email
+          phone
+          createdAt
+          offers(first: 30) {
+            edges {
+              node {
+                id
+                title
+                price
+                reviews(first: 10) {
+                  edges {
+                    node {
+                      id
+                      rating
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+TYPENAME_QUERY = """
+query SimpleQuery {
+  __typename
+}
+"""
+
+CREATE_REVIEW_MUTATION = """
+mutation CreateReview($input: CreateReviewInput!) {
+  createReview(input: $input) {
+    id
+    rating
+    text
+  }
+}
+"""
+
+USER_REVIEWS_QUERY = """
+query GetUserReviews($userId: ID!) {
+  user(id: $userId) {
+    id
+    email
+    phone
+    reviews {
+      edges {
+        node {
+          id
+          text
+        }
+      }
+    }
+  }
+}
+"""
+
+SQL_TEST_QUERY = """
+query TestSQLInjection($id: ID!) {
+  review(id: $id) {
+    id
+    rating
+    text
+  }
+}
+"""
+
+NOSQL_TEST_QUERY = """
+query TestNoSQLInjection($filter: ReviewsFilter) {
+  reviews(filter: $filter, first: 10) {
+    edges {
+      node {
+        id
+        rating
+      }
+    }
+  }
+}
+"""
+
+XSS_TEST_MUTATION = """
+mutation CreateReview($input: CreateReviewInput!) {
+  createReview(input: $input) {
+    id
+    text
+  }
+}
+"""
+
+CSRF_TEST_MUTATION = """
+mutation CreateReview($input: CreateReviewInput!) {
+  createReview(input: $input) {
+    id
+  }
+}
+"""
+
+LARGE_QUERY = """
+query LargeQuery {
+  offers(first: 1000) {
+    edges {
+      node {
+        id
+        title
+        description
+        reviews(first: 100) {
+          edges {
+            node {
+              id
+              text
+              author {
+                id
+                name
+                reviews(first: 50) {
+                  edges {
+                    node {
+                      id
+                      text
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+PRIVILEGE_ESCALATION_QUERY = """
+query TestPrivilegeEscalation {
+  __typename
+}
+"""
+
+# Attack payload catalogs, shared by every scan
+SQL_PAYLOADS = (
+    "' OR '1'='1",
+    "'; DROP TABLE reviews; --",
+    "' UNION SELECT * FROM users --",
+    "1' OR 1=1 --",
+    "'; SELECT pg_sleep(5); --",
+)
+
+NOSQL_PAYLOADS = (
+    {"$ne": None},
+    {"$gt": ""},
+    {"$regex": ".*"},
+    {"$where": "1==1"},
+    {"$or": [{"rating": 1}, {"rating": 5}]},
+)
+
+XSS_PAYLOADS = (
+    "<script>alert('XSS')</script>",
+    "javascript:alert('XSS')",
+    "<img src=x onerror=alert('XSS')>",
+    "';alert('XSS');//",
+    "<svg onload=alert('XSS')>",
+)
+
+INVALID_QUERIES = (
+    "query { nonExistentField }",
+    "query { user(id: \"invalid-uuid\") { id } }",
+    "mutation { nonExistentMutation }",
+    "query { review(id: null) { id } }",
+)
+
+# HTML report templates, filled with str.format; every interpolated text field is escaped first
+HTML_REPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Security Audit Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; }}
+        .critical {{ color: #dc3545; }}
+        .high {{ color: #fd7e14; }}
+        .medium {{ color: #ffc107; }}
+        .low {{ color: #28a745; }}
+        .info {{ color: #17a2b8; }}
+    </style>
+</head>
+<body>
+    <h1>Security Audit Report</h1>
+    <p><strong>Target:</strong> {target}</p>
+    <p><strong>Security Score:</strong> {score}/100</p>
+    <h2>Vulnerabilities Found</h2>
+    <ul>
+"""
+HTML_FINDING = """        <li class="{severity_class}">
+            <strong>[{severity}] {title}</strong><br>
+            {description}<br>
+            <em>Evidence: {evidence}</em>
+        </li>
+"""
+HTML_RECOMMENDATIONS_HEAD = """    </ul>
+    <h2>Recommendations</h2>
+    <ul>
+"""
+HTML_RECOMMENDATION = """        <li>{}</li>
+"""
+HTML_REPORT_TAIL = """    </ul>
+</body>
+</html>
+"""
 
 class SecurityScanner:
-    def __init__(self, base_url: str, auth_token: Optional[str] = None):
+    def __init__(self, base_url: str, auth_token: Optional[str] = None, introspection_cache: bool = True,
+                 batch: bool = False, jwt_public_key: Optional[bytes] = None):
         self.base_url = base_url.rstrip('/')
         self.graphql_url = urljoin(self.base_url, '/graphql')
         self.auth_token = auth_token
-        self.session = requests.Session()
+        self.introspection_cache = introspection_cache
+        self.batch = batch
+        self.jwt_public_key = jwt_public_key
+        self._batch_supported: Optional[bool] = None  # unknown until the first batch is tried
         self.vulnerabilities = []
         self.test_results = {}
+        self._vulnerabilities_lock = threading.Lock()
+        self._vulnerability_index: Dict[tuple, Dict[str, Any]] = {}
+        self._local = threading.local()
+        
+        # One keep-alive pool shared by every thread's session, sized for the concurrent bursts.
+        # Only failed connection attempts are retried: a resent probe would skew the tests.
+        self._adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128,
+                                    max_retries=Retry(total=2, read=0, status=0, backoff_factor=0.1))
         
         # Set default headers
-        self.session.headers.update({
+        self.default_headers = {
             'Content-Type': 'application/json',
             'User-Agent': 'SecurityScanner/1.0'
-        })
+        }
         
         if auth_token:
-            self.session.headers['Authorization'] = f'Bearer {auth_token}'
+            self.default_headers['Authorization'] = f'Bearer {auth_token}'
+    
+    @property
+    def session(self) -> requests.Session:
+        """Per-thread session (Session is not thread-safe) sharing the scanner's connection pool"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            session.headers.update(self.default_headers)
+        return session
     
     def log_vulnerability(self, severity: str, title: str, description: str, evidence: str = ""):
-        """Log a discovered vulnerability"""
+        """Log a discovered vulnerability; repeats of an identical finding only bump its occurrence count"""
+        key = (severity, title, hashlib.blake2b(f'{description}\0{evidence}'.encode(), digest_size=8).digest())
         vulnerability = {
             'severity': severity,
             'title': title,
             'description': description,
             'evidence': evidence,
-            'timestamp': time.time()
-        }
-        self.vulnerabilities.append(vulnerability)
-        
-        # Color coding for console output
-        colors = {
-            'CRITICAL': '\033[91m',  # Red
-            'HIGH': '\033[93m',      # Yellow
-            'MEDIUM': '\033[94m',    # Blue
-            'LOW': '\033[92m',       # Green
-            'INFO': '\033[96m'       # Cyan
+            'timestamp': time.time(),
+            'occurrences': 1
         }
-        reset_color = '\033[0m'
         
-        color = colors.get(severity, '')
-        print(f"{color}[{severity}] {title}{reset_color}")
-        print(f"  {description}")
+        prefix = SEVERITY_PREFIXES.get(severity) or f'[{severity}] '
+        lines = [f"{prefix}{title}{RESET_COLOR}", f"  {description}"]
         if evidence:
-            print(f"  Evidence: {evidence}")
-        print()
+            lines.append(f"  Evidence: {evidence}")
+        
+        # Tests run concurrently; keep each record and its console block together
+        with self._vulnerabilities_lock:
+            known = self._vulnerability_index.get(key)
+            if known is not None:
+                known['occurrences'] += 1
+                return
+            self._vulnerability_index[key] = vulnerability
+            self.vulnerabilities.append(vulnerability)
+            print("\n".join(lines) + "\n\n", end="")
     
-    def make_graphql_request(self, query: str, variables: Dict = None, headers: Dict = None) -> requests.Response:
-        """Make a GraphQL request"""
+    def make_graphql_request(self, query: str, variables: Dict = None, headers: Dict = None,
+                             stream: bool = False) -> requests.Response:
+        """Make a GraphQL request; with stream=True the body is left unread"""
         payload = {
             'query': query,
             'variables': variables or {}
         }
         
-        request_headers = self.session.headers.copy()
-        if headers:
-            request_headers.update(headers)
-        
-        return self.session.post(self.graphql_url, json=payload, headers=request_headers)
+        # requests merges per-call headers over the session's own, so no copy is needed
+        return self.session.post(self.graphql_url, data=_json_dumps(payload), headers=headers, stream=stream,
+                                 timeout=REQUEST_TIMEOUT)
     
-    def test_graphql_introspection(self):
-        """Test GraphQL introspection availability"""
-        print("🔍 Testing GraphQL Introspection...")
-        
-        introspection_query = """
-        query IntrospectionQuery {
-          __schema {
-            queryType { name }
-            mutationType { name }
-            subscriptionType { name }
-            types {
-              ...FullType
-            }
-            directives {
-              name
-              description
-              locations
-              args {
-                ...InputValue
-              }
-            }
-          }
-        }
+    def fan_out(self, probe, items) -> List[Any]:
+        """Run independent I/O-bound probes concurrently, returning results in input order"""
+        items = list(items)
+        if len(items) < 2:
+            return [probe(item) for item in items]
+        with ThreadPoolExecutor(max_workers=len(items)) as executor:
+            return list(executor.map(probe, items))
+    
+    def make_graphql_batch(self, operations: List[Tuple[str, Optional[Dict]]]) -> List[Optional[Dict]]:
+        """Send several operations in one HTTP request using GraphQL query batching
         
-        fragment FullType on __Type {
-          kind
-          name
-          description
-          fields(includeDeprecated: true) {
-            name
-            description
-            args {
-              ...InputValue
-            }
-            type {
-              ...TypeRef
-            }
-            isDeprecated
-            deprecationReason
-          }
-          inputFields {
-            ...InputValue
-          }
-          interfaces {
-            ...TypeRef
-          }
-          enumValues(includeDeprecated: true) {
-            name
-            description
-            isDeprecated
-            deprecationReason
-          }
-          possibleTypes {
-            ...TypeRef
-          }
-        }
+        Returns the parsed response body per operation (None if it failed). Falls back to
+        individual concurrent requests when batching is not enabled on the router, and
+        remembers that so later probe sets skip the batch attempt. A batch that fails in
+        transit (timeout, reset connection) is also sent one operation at a time.
+        """
+        if self._batch_supported is not False:
+            payload = [{'query': query, 'variables': variables or {}} for query, variables in operations]
+            try:
+                response = self.session.post(self.graphql_url, data=_json_dumps(payload), timeout=REQUEST_TIMEOUT)
+            except requests.RequestException:
+                response = None
+            
+            if response is not None:
+                if response.status_code == 200:
+                    try:
+                        results = _json_loads(response.content)
+                        if isinstance(results, list) and len(results) == len(operations):
+                            self._batch_supported = True
+                            return results
+                    except json.JSONDecodeError:
+                        pass
+                self._batch_supported = False
         
-        fragment InputValue on __InputValue {
-          name
-          description
-          type { ...TypeRef }
-          defaultValue
-        }
+        return self.fan_out(self._probe_body, operations)
+    
+    def run_probes(self, operations: List[Tuple[str, Optional[Dict]]]) -> List[Optional[Dict]]:
+        """Parsed response body per operation; one batched request with --batch, else concurrent requests"""
+        if self.batch:
+            return self.make_graphql_batch(operations)
+        return self.fan_out(self._probe_body, operations)
+    
+    def _probe_body(self, operation: Tuple[str, Optional[Dict]]) -> Optional[Dict]:
+        """Parsed response body of one operation, or None if the request or response failed"""
+        try:
+            return self._parse_body(self.make_graphql_request(*operation))
+        except requests.RequestException:
+            return None
+    
+    @staticmethod
+    def _parse_body(response: requests.Response) -> Optional[Dict]:
+        """Parsed JSON body of a successful response, or None"""
+        if response.status_code != 200:
+            return None
+        try:
+            return _json_loads(response.content)
+        except json.JSONDecodeError:
+            return None
+    
+    def _introspection_cache_path(self) -> str:
+        """Cache file for this endpoint's introspection response"""
+        key = hashlib.blake2b(self.graphql_url.encode(), digest_size=16).hexdigest()
+        return os.path.join(INTROSPECTION_CACHE_DIR, f'{key}.json')
+    
+    def _load_cached_introspection(self) -> Optional[bytes]:
+        """Return a fresh cached introspection body if a cheap probe shows introspection is still enabled"""
+        response = self.make_graphql_request(SCHEMA_PROBE_QUERY)
+        if response.status_code != 200 or b'"__schema"' not in response.content:
+            return None
+        try:
+            if '__schema' not in (_json_loads(response.content).get('data') or {}):
+                return None
+        except (json.JSONDecodeError, AttributeError):
+            return None
         
-        fragment TypeRef on __Type {
-          kind
-          name
-          ofType {
-            kind
-            name
-            ofType {
-              kind
-              name
-              ofType {
-                kind
-                name
-                ofType {
-                  kind
-                  name
-                  ofType {
-                    kind
-                    name
-                    ofType {
-                      kind
-                      name
-                      ofType {
-                        kind
-                        name
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
+        cache_path = self._introspection_cache_path()
+        try:
+            if time.time() - os.path.getmtime(cache_path) > INTROSPECTION_CACHE_TTL:
+                return None
+            with open(cache_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _store_cached_introspection(self, body: bytes):
+        """Write an introspection body to the cache; failures only cost a refetch next run"""
+        cache_path = self._introspection_cache_path()
+        try:
+            os.makedirs(INTROSPECTION_CACHE_DIR, exist_ok=True)
+            tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    def test_graphql_introspection(self):
+        """Test GraphQL introspection availability"""
+        print("🔍 Testing GraphQL Introspection...\n", end="")
         
-        response = self.make_graphql_request(introspection_query)
+        body = self._load_cached_introspection() if self.introspection_cache else None
+        from_cache = body is not None
+        if not from_cache:
+            response = self.make_graphql_request(INTROSPECTION_QUERY)
+            if response.status_code == 200:
+                body = response.content
         
-        if response.status_code == 200:
+        if body is not None:
             try:
-                data = response.json()
+                data = _json_loads(body)
                 if 'data' in data and '__schema' in data['data']:
+                    if self.introspection_cache and not from_cache:
+                        self._store_cached_introspection(body)
                     self.log_vulnerability(
                         'MEDIUM',
                         'GraphQL Introspection Enabled',
@@ -204,171 +670,68 @@ class SecurityScanner:
         )
         return None
     
-    def test_query_depth_limiting(self):
-        """Test query depth limiting"""
-        print("🔍 Testing Query Depth Limiting...")
+    def _probe_depth(self, depth: int) -> Tuple[Optional[str], bool]:
+        """Return the depth-limit error (if any) for a query nested `depth` levels, and whether it returned data"""
+        response = self.make_graphql_request(_build_nested_query(depth))
+        if response.status_code != 200:
+            return None, False
         
-        # Create a deeply nested query
-        deep_query = """
-        query DeepQuery {
-          offers(first: 1) {
-            edges {
-              node {
-                reviews(first: 1) {
-                  edges {
-                    node {
-                      author {
-                        reviews(first: 1) {
-                          edges {
-                            node {
-                              offer {
-                                reviews(first: 1) {
-                                  edges {
-                                    node {
-                                      author {
-                                        reviews(first: 1) {
-                                          edges {
-                                            node {
-                                              offer {
-                                                reviews(first: 1) {
-                                                  edges {
-                                                    node {
-                                                      id
-                                                    }
-                                                  }
-                                                }
-                                              }
-                                            }
-                                          }
-                                        }
-                                      }
-                                    }
-                                  }
-                                }
-                              }
-                            }
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
+        try:
+            data = _json_loads(response.content)
+        except json.JSONDecodeError:
+            return None, False
+        
+        for error in data.get('errors', []):
+            if DEPTH_LIMIT_RE.search(error.get('message', '')):
+                return error['message'], False
+        return None, 'data' in data
+    
+    def test_query_depth_limiting(self):
+        """Test query depth limiting and locate the limit by bisecting on nesting depth"""
+        print("🔍 Testing Query Depth Limiting...\n", end="")
+        
+        depth_error, executed = self._probe_depth(MAX_PROBE_DEPTH)
+        if depth_error is None:
+            # If no depth limit error, it might be vulnerable
+            if executed:
+                self.log_vulnerability(
+                    'HIGH',
+                    'No Query Depth Limiting',
+                    'Deep nested queries are allowed, which could lead to DoS attacks.',
+                    f'Query nested {MAX_PROBE_DEPTH} levels deep executed successfully without depth limit error'
+                )
+            return
         
-        response = self.make_graphql_request(deep_query)
+        # Bisect for the deepest nesting the server still accepts
+        accepted, rejected = MIN_PROBE_DEPTH - 1, MAX_PROBE_DEPTH
+        while rejected - accepted > 1:
+            depth = (accepted + rejected) // 2
+            error, _ = self._probe_depth(depth)
+            if error is None:
+                accepted = depth
+            else:
+                rejected, depth_error = depth, error
         
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if 'errors' in data:
-                    # Check if error is related to query depth
-                    for error in data['errors']:
-                        if 'depth' in error.get('message', '').lower():
-                            self.log_vulnerability(
-                                'INFO',
-                                'Query Depth Limiting Enabled',
-                                'Query depth limiting is properly configured.',
-                                f'Depth limit error: {error["message"]}'
-                            )
-                            return
-                
-                # If no depth limit error, it might be vulnerable
-                if 'data' in data:
-                    self.log_vulnerability(
-                        'HIGH',
-                        'No Query Depth Limiting',
-                        'Deep nested queries are allowed, which could lead to DoS attacks.',
-                        'Deep query executed successfully without depth limit error'
-                    )
-            except json.JSONDecodeError:
-                pass
+        self.log_vulnerability(
+            'INFO',
+            'Query Depth Limiting Enabled',
+            f'Query depth limiting is properly configured. Queries nested more than {accepted} levels deep are rejected.',
+            f'Depth limit error at {rejected} levels: {depth_error}'
+        )
     
     def test_query_complexity_limiting(self):
         """Test query complexity limiting"""
-        print("🔍 Testing Query Complexity Limiting...")
+        print("🔍 Testing Query Complexity Limiting...\n", end="")
         
-        # Create a complex query with many fields
-        complex_query = """
-        query ComplexQuery {
-          offers(first: 100) {
-            edges {
-              node {
-                id
-                title
-                price
-                description
-                createdAt
-                updatedAt
-                reviews(first: 50) {
-                  edges {
-                    node {
-                      id
-                      rating
-                      text
-                      createdAt
-                      updatedAt
-                      author {
-                        id
-                        name
-                        email
-                        createdAt
-                        reviews(first: 20) {
-                          edges {
-                            node {
-                              id
-                              rating
-                              text
-                              createdAt
-                            }
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-                seller {
-                  id
-                  name
-                  email
-                  phone
-                  createdAt
-                  offers(first: 30) {
-                    edges {
-                      node {
-                        id
-                        title
-                        price
-                        reviews(first: 10) {
-                          edges {
-                            node {
-                              id
-                              rating
-                            }
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
-        
-        response = self.make_graphql_request(complex_query)
+        # Query with many fields across several nested connections
+        response = self.make_graphql_request(COMPLEX_QUERY)
         
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'errors' in data:
                     for error in data['errors']:
-                        if any(keyword in error.get('message', '').lower() 
-                              for keyword in ['complexity', 'cost', 'limit']):
+                        if COMPLEXITY_LIMIT_RE.search(error.get('message', '')):
                             self.log_vulnerability(
                                 'INFO',
                                 'Query Complexity Limiting Enabled',
@@ -389,40 +752,39 @@ class SecurityScanner:
     
     def test_rate_limiting(self):
         """Test rate limiting"""
-        print("🔍 Testing Rate Limiting...")
+        print("🔍 Testing Rate Limiting...\n", end="")
         
-        simple_query = """
-        query SimpleQuery {
-          __typename
-        }
-        """
-        
-        # Send rapid requests to test rate limiting
+        # Send one concurrent burst of requests to test rate limiting
         request_count = 100
-        successful_requests = 0
-        rate_limited_requests = 0
         
-        start_time = time.time()
-        
-        for i in range(request_count):
-            response = self.make_graphql_request(simple_query)
+        # Unanswered requests make the result inconclusive rather than failing the test
+        def burst_request(_):
+            try:
+                response = self.make_graphql_request(TYPENAME_QUERY)
+            except requests.RequestException:
+                return None
             
             if response.status_code == 200:
-                successful_requests += 1
+                return 'ok'
             elif response.status_code == 429:  # Too Many Requests
-                rate_limited_requests += 1
+                return 'limited'
             elif response.status_code == 403:  # Forbidden (might be rate limiting)
                 try:
-                    data = response.json()
-                    if 'rate' in str(data).lower() or 'limit' in str(data).lower():
-                        rate_limited_requests += 1
+                    data = _json_loads(response.content)
+                    if RATE_LIMIT_RE.search(str(data)):
+                        return 'limited'
                 except:
                     pass
-            
-            # Small delay to avoid overwhelming the server
-            time.sleep(0.01)
+            return 'other'
         
-        end_time = time.time()
+        start_time = time.perf_counter()
+        
+        with ThreadPoolExecutor(max_workers=request_count) as executor:
+            outcomes = list(executor.map(burst_request, range(request_count)))
+        
+        end_time = time.perf_counter()
+        successful_requests = outcomes.count('ok')
+        rate_limited_requests = outcomes.count('limited')
         duration = end_time - start_time
         requests_per_second = request_count / duration
         
@@ -433,7 +795,7 @@ class SecurityScanner:
                 f'Rate limiting is working. {rate_limited_requests} out of {request_count} requests were rate limited.',
                 f'RPS attempted: {requests_per_second:.2f}, Rate limited: {rate_limited_requests}'
             )
-        else:
+        elif None not in outcomes:
             self.log_vulnerability(
                 'MEDIUM',
                 'No Rate Limiting Detected',
@@ -443,19 +805,9 @@ class SecurityScanner:
     
     def test_authentication_bypass(self):
         """Test authentication bypass vulnerabilities"""
-        print("🔍 Testing Authentication Bypass...")
+        print("🔍 Testing Authentication Bypass...\n", end="")
         
         # Test without authentication token
-        protected_query = """
-        mutation CreateReview($input: CreateReviewInput!) {
-          createReview(input: $input) {
-            id
-            rating
-            text
-          }
-        }
-        """
-        
         variables = {
             "input": {
                 "offerId": "550e8400-e29b-41d4-a716-446655440001",
@@ -464,20 +816,12 @@ class SecurityScanner:
             }
         }
         
-        # Remove auth token temporarily
-        original_auth = self.session.headers.get('Authorization')
-        if 'Authorization' in self.session.headers:
-            del self.session.headers['Authorization']
-        
-        response = self.make_graphql_request(protected_query, variables)
-        
-        # Restore auth token
-        if original_auth:
-            self.session.headers['Authorization'] = original_auth
+        # A None override makes requests drop the session's Authorization header for this request only
+        response = self.make_graphql_request(CREATE_REVIEW_MUTATION, variables, headers={'Authorization': None})
         
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'data' in data and data['data'].get('createReview'):
                     self.log_vulnerability(
                         'CRITICAL',
@@ -488,8 +832,7 @@ class SecurityScanner:
                 elif 'errors' in data:
                     # Check if error is authentication-related
                     for error in data['errors']:
-                        if any(keyword in error.get('message', '').lower() 
-                              for keyword in ['unauthorized', 'authentication', 'token']):
+                        if AUTH_ERROR_RE.search(error.get('message', '')):
                             self.log_vulnerability(
                                 'INFO',
                                 'Authentication Required',
@@ -502,35 +845,16 @@ class SecurityScanner:
     
     def test_authorization_bypass(self):
         """Test authorization bypass vulnerabilities"""
-        print("🔍 Testing Authorization Bypass...")
-        
-        # Test accessing other user's data
-        other_user_query = """
-        query GetUserReviews($userId: ID!) {
-          user(id: $userId) {
-            id
-            email
-            phone
-            reviews {
-              edges {
-                node {
-                  id
-                  text
-                }
-              }
-            }
-          }
-        }
-        """
+        print("🔍 Testing Authorization Bypass...\n", end="")
         
         # Try to access another user's sensitive data
         variables = {"userId": "660e8400-e29b-41d4-a716-446655440999"}
         
-        response = self.make_graphql_request(other_user_query, variables)
+        response = self.make_graphql_request(USER_REVIEWS_QUERY, variables)
         
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'data' in data and data['data'].get('user'):
                     user_data = data['data']['user']
                     if user_data.get('email') or user_data.get('phone'):
@@ -545,63 +869,40 @@ class SecurityScanner:
     
     def test_sql_injection(self):
         """Test SQL injection vulnerabilities"""
-        print("🔍 Testing SQL Injection...")
+        print("🔍 Testing SQL Injection...\n", end="")
         
-        # SQL injection payloads
-        sql_payloads = [
-            "' OR '1'='1",
-            "'; DROP TABLE reviews; --",
-            "' UNION SELECT * FROM users --",
-            "1' OR 1=1 --",
-            "'; SELECT pg_sleep(5); --"
-        ]
+        responses = self.fan_out(
+            lambda payload: self.make_graphql_request(SQL_TEST_QUERY, {"id": payload}), SQL_PAYLOADS
+        )
         
-        for payload in sql_payloads:
-            query = """
-            query TestSQLInjection($id: ID!) {
-              review(id: $id) {
-                id
-                rating
-                text
-              }
-            }
-            """
-            
-            variables = {"id": payload}
-            
-            start_time = time.time()
-            response = self.make_graphql_request(query, variables)
-            end_time = time.time()
+        # Payloads are probed concurrently and judged in order; response.elapsed times each request on its own
+        for payload, response in zip(SQL_PAYLOADS, responses):
+            response_time = response.elapsed.total_seconds()
             
             # Check for SQL injection indicators
             if response.status_code == 200:
                 try:
-                    data = response.json()
-                    response_text = json.dumps(data).lower()
-                    
-                    # Check for SQL error messages
-                    sql_errors = [
-                        'syntax error', 'mysql', 'postgresql', 'ora-', 'microsoft',
-                        'driver', 'odbc', 'jdbc', 'sql server', 'pg_'
-                    ]
+                    data = _json_loads(response.content)
                     
-                    for error_pattern in sql_errors:
-                        if error_pattern in response_text:
-                            self.log_vulnerability(
-                                'CRITICAL',
-                                'SQL Injection Vulnerability',
-                                f'SQL injection detected with payload: {payload}',
-                                f'Error pattern found: {error_pattern}'
-                            )
-                            return
+                    # Check for SQL error messages; they surface in the GraphQL errors array
+                    messages = (error.get('message', '') for error in data.get('errors', []))
+                    match = next(filter(None, map(SQL_ERROR_RE.search, messages)), None)
+                    if match:
+                        self.log_vulnerability(
+                            'CRITICAL',
+                            'SQL Injection Vulnerability',
+                            f'SQL injection detected with payload: {payload}',
+                            f'Error pattern found: {match.group(0).lower()}'
+                        )
+                        return
                     
                     # Check for time-based SQL injection (sleep payload)
-                    if 'pg_sleep' in payload and (end_time - start_time) > 4:
+                    if 'pg_sleep' in payload and response_time > 4:
                         self.log_vulnerability(
                             'CRITICAL',
                             'Time-based SQL Injection',
                             f'Time-based SQL injection detected with payload: {payload}',
-                            f'Response time: {end_time - start_time:.2f}s'
+                            f'Response time: {response_time:.2f}s'
                         )
                         return
                         
@@ -610,73 +911,27 @@ class SecurityScanner:
     
     def test_nosql_injection(self):
         """Test NoSQL injection vulnerabilities"""
-        print("🔍 Testing NoSQL Injection...")
+        print("🔍 Testing NoSQL Injection...\n", end="")
         
-        # NoSQL injection payloads
-        nosql_payloads = [
-            {"$ne": None},
-            {"$gt": ""},
-            {"$regex": ".*"},
-            {"$where": "1==1"},
-            {"$or": [{"rating": 1}, {"rating": 5}]}
-        ]
+        results = self.run_probes([(NOSQL_TEST_QUERY, {"filter": payload}) for payload in NOSQL_PAYLOADS])
         
-        for payload in nosql_payloads:
-            query = """
-            query TestNoSQLInjection($filter: ReviewsFilter) {
-              reviews(filter: $filter, first: 10) {
-                edges {
-                  node {
-                    id
-                    rating
-                  }
-                }
-              }
-            }
-            """
-            
-            variables = {"filter": payload}
-            
-            response = self.make_graphql_request(query, variables)
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if 'data' in data and data['data'].get('reviews'):
-                        reviews = data['data']['reviews']['edges']
-                        if len(reviews) > 0:
-                            self.log_vulnerability(
-                                'HIGH',
-                                'Potential NoSQL Injection',
-                                f'NoSQL injection payload returned data: {payload}',
-                                f'Returned {len(reviews)} reviews'
-                            )
-                except json.JSONDecodeError:
-                    pass
+        for payload, data in zip(NOSQL_PAYLOADS, results):
+            if data and 'data' in data and data['data'].get('reviews'):
+                reviews = data['data']['reviews']['edges']
+                if len(reviews) > 0:
+                    self.log_vulnerability(
+                        'HIGH',
+                        'Potential NoSQL Injection',
+                        f'NoSQL injection payload returned data: {payload}',
+                        f'Returned {len(reviews)} reviews'
+                    )
     
     def test_xss_vulnerabilities(self):
         """Test Cross-Site Scripting vulnerabilities"""
-        print("🔍 Testing XSS Vulnerabilities...")
+        print("🔍 Testing XSS Vulnerabilities...\n", end="")
         
-        xss_payloads = [
-            "<script>alert('XSS')</script>",
-            "javascript:alert('XSS')",
-            "<img src=x onerror=alert('XSS')>",
-            "';alert('XSS');//",
-            "<svg onload=alert('XSS')>"
-        ]
-        
-        for payload in xss_payloads:
+        def xss_probe(payload):
             # Test XSS in review creation
-            mutation = """
-            mutation CreateReview($input: CreateReviewInput!) {
-              createReview(input: $input) {
-                id
-                text
-              }
-            }
-            """
-            
             variables = {
                 "input": {
                     "offerId": "550e8400-e29b-41d4-a716-446655440001",
@@ -684,12 +939,13 @@ class SecurityScanner:
                     "text": payload
                 }
             }
-            
-            response = self.make_graphql_request(mutation, variables)
-            
-            if response.status_code == 200:
+            return self.make_graphql_request(XSS_TEST_MUTATION, variables)
+        
+        for payload, response in zip(XSS_PAYLOADS, self.fan_out(xss_probe, XSS_PAYLOADS)):
+            # Only a response that mentions the created review is worth parsing
+            if response.status_code == 200 and b'"createReview"' in response.content:
                 try:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     if 'data' in data and data['data'].get('createReview'):
                         review_text = data['data']['createReview'].get('text', '')
                         if payload in review_text:
@@ -704,57 +960,26 @@ class SecurityScanner:
     
     def test_information_disclosure(self):
         """Test information disclosure vulnerabilities"""
-        print("🔍 Testing Information Disclosure...")
-        
-        # Test error message disclosure
-        invalid_queries = [
-            "query { nonExistentField }",
-            "query { user(id: \"invalid-uuid\") { id } }",
-            "mutation { nonExistentMutation }",
-            "query { review(id: null) { id } }"
-        ]
-        
-        for query in invalid_queries:
-            response = self.make_graphql_request(query)
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if 'errors' in data:
-                        for error in data['errors']:
-                            error_message = error.get('message', '').lower()
-                            
-                            # Check for sensitive information in error messages
-                            sensitive_patterns = [
-                                'database', 'sql', 'connection', 'server',
-                                'internal', 'stack trace', 'file path',
-                                'password', 'secret', 'token'
-                            ]
-                            
-                            for pattern in sensitive_patterns:
-                                if pattern in error_message:
-                                    self.log_vulnerability(
-                                        'MEDIUM',
-                                        'Information Disclosure in Error Messages',
-                                        f'Error message contains sensitive information: {pattern}',
-                                        f'Error: {error["message"]}'
-                                    )
-                except json.JSONDecodeError:
-                    pass
+        print("🔍 Testing Information Disclosure...\n", end="")
+        
+        for data in self.run_probes([(query, None) for query in INVALID_QUERIES]):
+            if data and 'errors' in data:
+                for error in data['errors']:
+                    # Check for sensitive information in error messages, once per distinct term
+                    matches = SENSITIVE_RE.findall(error.get('message', ''))
+                    for pattern in dict.fromkeys(match.lower() for match in matches):
+                        self.log_vulnerability(
+                            'MEDIUM',
+                            'Information Disclosure in Error Messages',
+                            f'Error message contains sensitive information: {pattern}',
+                            f'Error: {error["message"]}'
+                        )
     
     def test_csrf_protection(self):
         """Test CSRF protection"""
-        print("🔍 Testing CSRF Protection...")
+        print("🔍 Testing CSRF Protection...\n", end="")
         
         # Test if mutations can be executed via GET request
-        mutation_query = """
-        mutation CreateReview($input: CreateReviewInput!) {
-          createReview(input: $input) {
-            id
-          }
-        }
-        """
-        
         variables = {
             "input": {
                 "offerId": "550e8400-e29b-41d4-a716-446655440001",
@@ -765,15 +990,16 @@ class SecurityScanner:
         
         # Try to execute mutation via GET request
         params = {
-            'query': mutation_query,
-            'variables': json.dumps(variables)
+            'query': CSRF_TEST_MUTATION,
+            'variables': _json_dumps(variables).decode()
         }
         
-        response = self.session.get(self.graphql_url, params=params)
+        response = self.session.get(self.graphql_url, params=params, timeout=REQUEST_TIMEOUT)
         
-        if response.status_code == 200:
+        # Only a response that mentions the created review is worth parsing
+        if response.status_code == 200 and b'"createReview"' in response.content:
             try:
-                data = response.json()
+                data = _json_loads(response.content)
                 if 'data' in data and data['data'].get('createReview'):
                     self.log_vulnerability(
                         'HIGH',
@@ -786,50 +1012,25 @@ class SecurityScanner:
     
     def test_dos_vulnerabilities(self):
         """Test Denial of Service vulnerabilities"""
-        print("🔍 Testing DoS Vulnerabilities...")
-        
-        # Test resource exhaustion with large queries
-        large_query = """
-        query LargeQuery {
-          offers(first: 1000) {
-            edges {
-              node {
-                id
-                title
-                description
-                reviews(first: 100) {
-                  edges {
-                    node {
-                      id
-                      text
-                      author {
-                        id
-                        name
-                        reviews(first: 50) {
-                          edges {
-                            node {
-                              id
-                              text
-                            }
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
-        
-        start_time = time.time()
-        response = self.make_graphql_request(large_query)
-        end_time = time.time()
+        print("🔍 Testing DoS Vulnerabilities...\n", end="")
         
-        response_time = end_time - start_time
+        # Test resource exhaustion with large queries; only the status and timing matter,
+        # so the (potentially huge) body is never downloaded
+        try:
+            with self.make_graphql_request(LARGE_QUERY, stream=True) as response:
+                status_code = response.status_code
+                response_time = response.elapsed.total_seconds()
+        except requests.Timeout:
+            # No answer within the timeout is the slowest case of all, not a failed probe
+            self.log_vulnerability(
+                'MEDIUM',
+                'Potential DoS via Resource Exhaustion',
+                f'Large query did not complete within {REQUEST_TIMEOUT[1]} seconds, indicating potential DoS vulnerability.',
+                f'Query response time: >= {REQUEST_TIMEOUT[1]}s (timed out)'
+            )
+            return
         
-        if response.status_code == 200 and response_time > 10:
+        if status_code == 200 and response_time > 10:
             self.log_vulnerability(
                 'MEDIUM',
                 'Potential DoS via Resource Exhaustion',
@@ -839,7 +1040,7 @@ class SecurityScanner:
     
     def test_jwt_vulnerabilities(self):
         """Test JWT token vulnerabilities"""
-        print("🔍 Testing JWT Vulnerabilities...")
+        print("🔍 Testing JWT Vulnerabilities...\n", end="")
         
         if not self.auth_token:
             self.log_vulnerability(
@@ -850,48 +1051,97 @@ class SecurityScanner:
             )
             return
         
-        # Test with modified JWT token
+        # Test with forged variants of the JWT token
         try:
             # Decode JWT (without verification for testing)
             parts = self.auth_token.split('.')
             if len(parts) == 3:
-                header = json.loads(base64.urlsafe_b64decode(parts[0] + '=='))
-                payload = json.loads(base64.urlsafe_b64decode(parts[1] + '=='))
+                header, payload = _decode_jwt(self.auth_token)
                 
-                # Test with modified payload
-                modified_payload = payload.copy()
-                modified_payload['roles'] = ['admin', 'moderator']  # Privilege escalation
+                # Unchanged segments are reused as-is; only the tampered one is re-encoded
+                header_b64, payload_b64, signature_b64 = (part.encode() for part in parts)
+                escalated_payload = {**payload, 'roles': ['admin', 'moderator']}  # Privilege escalation
+                now = int(time.time())
+                expired_payload = {**payload, 'iat': now - 2 * 3600, 'exp': now - 3600}
                 
-                modified_payload_b64 = base64.urlsafe_b64encode(
-                    json.dumps(modified_payload).encode()
-                ).decode().rstrip('=')
+                # (title, description, evidence, forged token)
+                tampered_variant = (
+                    'JWT Signature Not Verified',
+                    'Modified JWT tokens are accepted, indicating signature verification is not implemented.',
+                    f'Modified token accepted with roles: {escalated_payload["roles"]}',
+                    b'.'.join((header_b64, _b64url_json(escalated_payload), signature_b64))
+                )
                 
-                modified_token = f"{parts[0]}.{modified_payload_b64}.{parts[2]}"
+                # Every other forgery also fails signature verification, so it only shows a separate
+                # flaw when the tampered-claims token above is rejected
+                dependent_variants = [
+                    (
+                        'JWT "none" Algorithm Accepted',
+                        'Unsigned tokens declaring alg "none" are accepted, so anyone can mint valid tokens.',
+                        'Token with alg=none and an empty signature accepted',
+                        b'.'.join((_b64url_json({**header, 'alg': 'none'}), payload_b64, b''))
+                    ),
+                ]
                 
-                # Test with modified token
-                test_query = """
-                query TestPrivilegeEscalation {
-                  __typename
-                }
-                """
+                # Forged variants that stand on their own, whatever the signature check does
+                independent_variants = []
                 
-                response = self.make_graphql_request(
-                    test_query, 
-                    headers={'Authorization': f'Bearer {modified_token}'}
-                )
+                # Expiry: the supplied token itself is the only correctly signed expired token available.
+                # Otherwise exp is moved into the past under the original signature, which a verifying
+                # server rejects whether or not it checks exp - so this cannot tell the two apart there
+                token_exp = payload.get('exp')
+                if isinstance(token_exp, (int, float)) and token_exp < now:
+                    independent_variants.append((
+                        'JWT Expiry Not Enforced',
+                        'The supplied token has expired but is still accepted.',
+                        f'Token accepted although its exp ({int(token_exp)}) lies in the past',
+                        self.auth_token.encode()
+                    ))
+                else:
+                    dependent_variants.append((
+                        'JWT Expiry Not Enforced',
+                        'A token whose exp claim was moved into the past is accepted although signature '
+                        'tampering is rejected. Re-run with an expired, correctly signed token for a '
+                        'conclusive check.',
+                        f'Token accepted with exp {expired_payload["exp"]} (expired an hour ago)',
+                        b'.'.join((header_b64, _b64url_json(expired_payload), signature_b64))
+                    ))
                 
-                if response.status_code == 200:
+                # Algorithm confusion: re-sign as HS256 with the server's public key as the HMAC secret
+                alg = str(header.get('alg', '')).upper()
+                if self.jwt_public_key and alg[:2] in ('RS', 'PS', 'ES'):
+                    confused_input = _b64url_json({**header, 'alg': 'HS256'}) + b'.' + payload_b64
+                    confused_signature = base64.urlsafe_b64encode(
+                        hmac.new(self.jwt_public_key, confused_input, hashlib.sha256).digest()
+                    ).rstrip(b'=')
+                    dependent_variants.append((
+                        'JWT Algorithm Confusion',
+                        f'Tokens re-signed with HS256 using the {alg} public key as the HMAC secret are accepted.',
+                        f'HS256 token signed with the {alg} public key accepted',
+                        confused_input + b'.' + confused_signature
+                    ))
+                
+                def token_accepted(variant) -> bool:
+                    response = self.make_graphql_request(
+                        PRIVILEGE_ESCALATION_QUERY,
+                        headers={'Authorization': f'Bearer {variant[3].decode("ascii")}'}
+                    )
+                    if response.status_code != 200 or b'"data"' not in response.content:
+                        return False
                     try:
-                        data = response.json()
-                        if 'data' in data:
-                            self.log_vulnerability(
-                                'CRITICAL',
-                                'JWT Signature Not Verified',
-                                'Modified JWT tokens are accepted, indicating signature verification is not implemented.',
-                                f'Modified token accepted with roles: {modified_payload["roles"]}'
-                            )
+                        return 'data' in _json_loads(response.content)
                     except json.JSONDecodeError:
-                        pass
+                        return False
+                
+                variants = [tampered_variant, *independent_variants, *dependent_variants]
+                tampered_accepted, *other_accepted = self.fan_out(token_accepted, variants)
+                if tampered_accepted:
+                    self.log_vulnerability('CRITICAL', *tampered_variant[:3])
+                    other_accepted = other_accepted[:len(independent_variants)]
+                
+                for (title, description, evidence, _), accepted in zip(variants[1:], other_accepted):
+                    if accepted:
+                        self.log_vulnerability('CRITICAL', title, description, evidence)
                         
         except Exception as e:
             self.log_vulnerability(
@@ -904,24 +1154,13 @@ class SecurityScanner:
     def generate_report(self) -> Dict[str, Any]:
         """Generate security audit report"""
         
-        # Categorize vulnerabilities by severity
-        severity_counts = {'CRITICAL': 0, 'HIGH': 0, 'MEDIUM': 0, 'LOW': 0, 'INFO': 0}
-        for vuln in self.vulnerabilities:
-            severity_counts[vuln['severity']] += 1
+        # Categorize vulnerabilities by severity in a single pass
+        severity_counts = dict.fromkeys(SEVERITY_WEIGHTS, 0)
+        severity_counts.update(Counter(vuln['severity'] for vuln in self.vulnerabilities))
         
-        # Calculate security score (0-100)
-        total_issues = sum(severity_counts.values()) - severity_counts['INFO']
-        if total_issues == 0:
-            security_score = 100
-        else:
-            # Weight different severities
-            weighted_score = (
-                severity_counts['CRITICAL'] * 10 +
-                severity_counts['HIGH'] * 5 +
-                severity_counts['MEDIUM'] * 2 +
-                severity_counts['LOW'] * 1
-            )
-            security_score = max(0, 100 - weighted_score)
+        # Calculate security score (0-100) from the per-severity counts
+        weighted_score = sum(SEVERITY_WEIGHTS.get(severity, 0) * count for severity, count in severity_counts.items())
+        security_score = max(0, 100 - weighted_score)
         
         report = {
             'scan_timestamp': time.time(),
@@ -930,25 +1169,23 @@ class SecurityScanner:
             'severity_counts': severity_counts,
             'total_vulnerabilities': len(self.vulnerabilities),
             'vulnerabilities': self.vulnerabilities,
-            'recommendations': self.generate_recommendations()
+            'recommendations': self.generate_recommendations(severity_counts)
         }
         
         return report
     
-    def generate_recommendations(self) -> List[str]:
-        """Generate security recommendations based on findings"""
+    def generate_recommendations(self, severity_counts: Dict[str, int]) -> List[str]:
+        """Generate security recommendations from the per-severity finding counts"""
         recommendations = []
         
         # Check for critical issues
-        critical_issues = [v for v in self.vulnerabilities if v['severity'] == 'CRITICAL']
-        if critical_issues:
+        if severity_counts['CRITICAL']:
             recommendations.append("🚨 URGENT: Address all CRITICAL vulnerabilities immediately")
             recommendations.append("🔒 Implement proper input validation and sanitization")
             recommendations.append("🛡️ Enable JWT signature verification")
         
         # Check for high issues
-        high_issues = [v for v in self.vulnerabilities if v['severity'] == 'HIGH']
-        if high_issues:
+        if severity_counts['HIGH']:
             recommendations.append("⚠️ Address HIGH severity vulnerabilities as priority")
             recommendations.append("🔐 Implement proper authorization checks")
             recommendations.append("🚫 Add query complexity and depth limiting")
@@ -973,12 +1210,11 @@ class SecurityScanner:
         print(f"Target: {self.base_url}")
         print("=" * 50)
         
-        # Run all security tests
+        # Independent, I/O-bound security tests run concurrently
         test_methods = [
             self.test_graphql_introspection,
             self.test_query_depth_limiting,
             self.test_query_complexity_limiting,
-            self.test_rate_limiting,
             self.test_authentication_bypass,
             self.test_authorization_bypass,
             self.test_sql_injection,
@@ -986,11 +1222,20 @@ class SecurityScanner:
             self.test_xss_vulnerabilities,
             self.test_information_disclosure,
             self.test_csrf_protection,
-            self.test_dos_vulnerabilities,
             self.test_jwt_vulnerabilities
         ]
         
-        for test_method in test_methods:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(test_method): test_method for test_method in test_methods}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error in {futures[future].__name__}: {str(e)}")
+        
+        # Load-generating tests run afterwards, one at a time, so they neither skew nor are
+        # skewed by the other tests' traffic
+        for test_method in [self.test_rate_limiting, self.test_dos_vulnerabilities]:
             try:
                 test_method()
             except Exception as e:
@@ -1007,10 +1252,22 @@ def main():
     parser.add_argument('--token', '-t', help='JWT authentication token')
     parser.add_argument('--output', '-o', help='Output file for security report (JSON)')
     parser.add_argument('--format', '-f', choices=['json', 'html'], default='json', help='Output format')
+    parser.add_argument('--no-introspection-cache', action='store_true',
+                        help='Always fetch the full introspection schema instead of reusing a cached copy')
+    parser.add_argument('--jwt-public-key',
+                        help='PEM public key of the token issuer; enables the RS/HS256 algorithm-confusion probe')
+    parser.add_argument('--batch', action='store_true',
+                        help='Send independent probe queries as one batched request (requires router batching)')
     
     args = parser.parse_args()
     
-    scanner = SecurityScanner(args.url, args.token)
+    jwt_public_key = None
+    if args.jwt_public_key:
+        with open(args.jwt_public_key, 'rb') as f:
+            jwt_public_key = f.read()
+    
+    scanner = SecurityScanner(args.url, args.token, introspection_cache=not args.no_introspection_cache,
+                              batch=args.batch, jwt_public_key=jwt_public_key)
     report = scanner.run_full_scan()
     
     # Print summary
@@ -1024,59 +1281,28 @@ def main():
     # Save report
     if args.output:
         if args.format == 'json':
-            with open(args.output, 'w') as f:
-                json.dump(report, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(_json_dumps_pretty(report))
         elif args.format == 'html':
-            # Generate HTML report (simplified)
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Security Audit Report</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                    .critical {{ color: #dc3545; }}
-                    .high {{ color: #fd7e14; }}
-                    .medium {{ color: #ffc107; }}
-                    .low {{ color: #28a745; }}
-                    .info {{ color: #17a2b8; }}
-                </style>
-            </head>
-            <body>
-                <h1>Security Audit Report</h1>
-                <p><strong>Target:</strong> {report['target_url']}</p>
-                <p><strong>Security Score:</strong> {report['security_score']}/100</p>
-                <h2>Vulnerabilities Found</h2>
-                <ul>
-            """
-            
-            for vuln in report['vulnerabilities']:
-                severity_class = vuln['severity'].lower()
-                html_content += f"""
-                    <li class="{severity_class}">
-                        <strong>[{vuln['severity']}] {vuln['title']}</strong><br>
-                        {vuln['description']}<br>
-                        <em>Evidence: {vuln['evidence']}</em>
-                    </li>
-                """
-            
-            html_content += """
-                </ul>
-                <h2>Recommendations</h2>
-                <ul>
-            """
-            
-            for rec in report['recommendations']:
-                html_content += f"<li>{rec}</li>"
-            
-            html_content += """
-                </ul>
-            </body>
-            </html>
-            """
-            
+            # Generate HTML report (simplified), streamed to the file piece by piece.
+            # Findings quote attacker-controlled payloads and server messages, so escape them
             with open(args.output, 'w') as f:
-                f.write(html_content)
+                f.write(HTML_REPORT_HEAD.format(
+                    target=html.escape(report['target_url']), score=report['security_score']
+                ))
+                f.writelines(
+                    HTML_FINDING.format(
+                        severity_class=vuln['severity'].lower(),
+                        severity=vuln['severity'],
+                        title=html.escape(vuln['title']),
+                        description=html.escape(vuln['description']),
+                        evidence=html.escape(vuln['evidence'])
+                    )
+                    for vuln in report['vulnerabilities']
+                )
+                f.write(HTML_RECOMMENDATIONS_HEAD)
+                f.writelines(HTML_RECOMMENDATION.format(html.escape(rec)) for rec in report['recommendations'])
+                f.write(HTML_REPORT_TAIL)
         
         print(f"📄 Report saved to: {args.output}")
     